@@ -1,12 +1,42 @@
 """CDVL Crawler - Tools for crawling and downloading videos from cdvl.org"""
 
-import importlib.metadata
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from cdvl_crawler.crawler import CDVLCrawler
-from cdvl_crawler.downloader import CDVLDownloader
-from cdvl_crawler.exporter import CDVLExporter
-from cdvl_crawler.generator import CDVLSiteGenerator
-
-__version__ = importlib.metadata.version("cdvl_crawler")
+if TYPE_CHECKING:
+    from cdvl_crawler.crawler import CDVLCrawler
+    from cdvl_crawler.downloader import CDVLDownloader
+    from cdvl_crawler.exporter import CDVLExporter
+    from cdvl_crawler.generator import CDVLSiteGenerator
 
 __all__ = ["CDVLCrawler", "CDVLDownloader", "CDVLExporter", "CDVLSiteGenerator"]
+
+# Submodules are imported on first attribute access, so that e.g. the export
+# command does not pay for importing aiohttp
+_LAZY_IMPORTS = {
+    "CDVLCrawler": "cdvl_crawler.crawler",
+    "CDVLDownloader": "cdvl_crawler.downloader",
+    "CDVLExporter": "cdvl_crawler.exporter",
+    "CDVLSiteGenerator": "cdvl_crawler.generator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the public classes and resolve __version__ (PEP 562)"""
+    if name == "__version__":
+        # Reading package metadata touches the filesystem, so only do it on demand
+        from importlib.metadata import version
+
+        package_version = version("cdvl_crawler")
+        globals()["__version__"] = package_version
+        return package_version
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir()"""
+    return sorted({*globals(), *_LAZY_IMPORTS, "__version__"})
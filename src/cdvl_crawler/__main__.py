@@ -8,12 +8,7 @@ import asyncio
 import logging
 import os
 import sys
-
-from cdvl_crawler.crawler import CDVLCrawler
-from cdvl_crawler.downloader import CDVLDownloader
-from cdvl_crawler.exporter import CDVLExporter
-from cdvl_crawler.generator import CDVLSiteGenerator
-from cdvl_crawler.utils import require_license_acceptance
+from typing import Optional
 
 # Configure logging
 logging.basicConfig(
@@ -22,27 +17,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main():
-    """Main entry point for CDVL CLI"""
-    parser = argparse.ArgumentParser(
-        prog="cdvl-crawler",
-        description="Tools for crawling and downloading videos from CDVL",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-
-    # Add config argument at top level
-    parser.add_argument(
-        "-c",
-        "--config",
-        type=str,
-        help="Path to config file (optional if using environment variables)",
-    )
+def _positive_int(value: str) -> int:
+    """argparse type for options that need an integer of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
 
-    # Create subparsers for commands
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    subparsers.required = True
 
-    # Crawl command
+def _add_crawl_parser(subparsers) -> None:
+    """Add the crawl command"""
     crawl_parser = subparsers.add_parser(
         "crawl",
         help="Crawl and extract metadata from all videos and datasets",
@@ -66,23 +53,23 @@ def main():
     )
     crawl_parser.add_argument(
         "--max-concurrent",
-        type=int,
+        type=_positive_int,
         help="Maximum number of concurrent requests (default: 5)",
     )
     crawl_parser.add_argument(
         "--max-failures",
         type=int,
-        help="Stop after N consecutive empty/failed responses (default: 1000)",
+        help="Stop after N consecutive empty/failed responses (default: 1000; gap probing usually stops the crawl first, see --probe-step)",
     )
     crawl_parser.add_argument(
         "--delay",
         type=float,
-        help="Delay between request batches in seconds (default: 0.1)",
+        help="Pause after each request before starting another (seconds, default: 0.1)",
     )
     crawl_parser.add_argument(
         "--probe-step",
         type=int,
-        help="How far ahead to jump when probing for ID gaps (default: 100)",
+        help="After N misses in a row, probe every Nth ID ahead and stop if none has content (default: 100, 0 disables probing)",
     )
     crawl_parser.add_argument(
         "--max-probe-attempts",
@@ -105,7 +92,9 @@ def main():
         help="Automatically accept the CDVL license agreement without prompting",
     )
 
-    # Download command
+
+def _add_download_parser(subparsers) -> None:
+    """Add the download command"""
     download_parser = subparsers.add_parser(
         "download",
         help="Download videos by ID",
@@ -135,7 +124,9 @@ Examples:
         help="Video ID(s) to download (comma-separated for multiple)",
     )
     download_parser.add_argument(
-        "--dry-run", action="store_true", help="Print download URL without downloading"
+        "--dry-run",
+        action="store_true",
+        help="Print download URL without downloading (still requires login)",
     )
     download_parser.add_argument(
         "-o",
@@ -159,8 +150,21 @@ Examples:
         action="store_true",
         help="Disable resume capability (always download from beginning)",
     )
+    download_parser.add_argument(
+        "--max-concurrent",
+        type=_positive_int,
+        help="Maximum number of videos to download in parallel (default: 3)",
+    )
+    download_parser.add_argument(
+        "--segments",
+        type=_positive_int,
+        help="Parallel connections per video when the server supports range "
+        "requests (default: 4, 1 disables splitting)",
+    )
+
 
-    # Generate site command
+def _add_site_parser(subparsers) -> None:
+    """Add the generate-site command"""
     site_parser = subparsers.add_parser(
         "generate-site",
         help="Generate a static HTML site from videos.jsonl",
@@ -181,7 +185,9 @@ Examples:
         help="Output HTML file (default: index.html)",
     )
 
-    # Export command
+
+def _add_export_parser(subparsers) -> None:
+    """Add the export command"""
     export_parser = subparsers.add_parser(
         "export",
         help="Export JSONL data to CSV format",
@@ -219,7 +225,95 @@ Examples:
         help="Comma-separated list of columns to export (default: all columns)",
     )
 
-    args = parser.parse_args()
+
+# Subcommand parser builders, keyed by command name
+_COMMAND_PARSERS = {
+    "crawl": _add_crawl_parser,
+    "download": _add_download_parser,
+    "generate-site": _add_site_parser,
+    "export": _add_export_parser,
+}
+
+
+# Crawl CLI arguments that override config values, as (argument, config key)
+_CRAWL_OVERRIDES = (
+    ("start_video_id", "start_video_id"),
+    ("start_dataset_id", "start_dataset_id"),
+    ("max_concurrent", "max_concurrent_requests"),
+    ("max_failures", "max_consecutive_failures"),
+    ("delay", "request_delay"),
+    ("probe_step", "probe_step"),
+    ("max_probe_attempts", "max_probe_attempts"),
+    ("max_video_id", "max_video_id"),
+    ("max_dataset_id", "max_dataset_id"),
+)
+
+
+def _find_command(argv: list[str]) -> Optional[str]:
+    """Return the subcommand named in argv, skipping top-level options"""
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+        elif arg in ("-c", "--config"):
+            skip_value = True
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI argument parser
+
+    Args:
+        command: If a known command, only that subcommand's parser is built;
+            otherwise all subcommands are added (e.g. for --help output)
+
+    Returns:
+        The configured argument parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="cdvl-crawler",
+        description="Tools for crawling and downloading videos from CDVL",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    # Add config argument at top level
+    parser.add_argument(
+        "-c",
+        "--config",
+        type=str,
+        help="Path to config file (optional if using environment variables)",
+    )
+
+    # Create subparsers for commands
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    subparsers.required = True
+
+    if command in _COMMAND_PARSERS:
+        _COMMAND_PARSERS[command](subparsers)
+    else:
+        for add_parser in _COMMAND_PARSERS.values():
+            add_parser(subparsers)
+
+    return parser
+
+
+def _run_async(coro):
+    """Run a coroutine, using uvloop's faster event loop if it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+def main():
+    """Main entry point for CDVL CLI"""
+    argv = sys.argv[1:]
+    parser = build_parser(_find_command(argv))
+    args = parser.parse_args(argv)
 
     # If no config specified, check if config.json exists in current directory
     if args.config is None and os.path.exists("config.json"):
@@ -228,9 +322,9 @@ Examples:
 
     # Run the appropriate command
     if args.command == "crawl":
-        asyncio.run(run_crawler(args))
+        _run_async(run_crawler(args))
     elif args.command == "download":
-        asyncio.run(run_downloader(args))
+        sys.exit(_run_async(run_downloader(args)))
     elif args.command == "generate-site":
         run_generator(args)
     elif args.command == "export":
@@ -239,31 +333,20 @@ Examples:
 
 async def run_crawler(args):
     """Run the crawler"""
+    from cdvl_crawler.crawler import CDVLCrawler
+    from cdvl_crawler.utils import require_license_acceptance
+
     # Check license acceptance
     if not require_license_acceptance(auto_accept=args.accept_license):
         logger.error("License agreement not accepted. Exiting.")
         sys.exit(1)
 
     # Build overrides dict from CLI arguments
-    overrides = {}
-    if args.start_video_id is not None:
-        overrides["start_video_id"] = args.start_video_id
-    if args.start_dataset_id is not None:
-        overrides["start_dataset_id"] = args.start_dataset_id
-    if args.max_concurrent is not None:
-        overrides["max_concurrent_requests"] = args.max_concurrent
-    if args.max_failures is not None:
-        overrides["max_consecutive_failures"] = args.max_failures
-    if args.delay is not None:
-        overrides["request_delay"] = args.delay
-    if args.probe_step is not None:
-        overrides["probe_step"] = args.probe_step
-    if args.max_probe_attempts is not None:
-        overrides["max_probe_attempts"] = args.max_probe_attempts
-    if args.max_video_id is not None:
-        overrides["max_video_id"] = args.max_video_id
-    if args.max_dataset_id is not None:
-        overrides["max_dataset_id"] = args.max_dataset_id
+    overrides = {
+        key: value
+        for attr, key in _CRAWL_OVERRIDES
+        if (value := getattr(args, attr)) is not None
+    }
 
     crawler = CDVLCrawler(
         config_path=args.config, output_dir=args.output_dir, overrides=overrides
@@ -271,81 +354,143 @@ async def run_crawler(args):
     await crawler.crawl()
 
 
-async def run_downloader(args):
-    """Run the downloader with parsed arguments"""
-    # Check license acceptance
-    if not require_license_acceptance(auto_accept=args.accept_license):
-        logger.error("License agreement not accepted. Exiting.")
-        sys.exit(1)
+async def run_downloader(args) -> int:
+    """Run the downloader with parsed arguments
+
+    Returns:
+        Process exit code (0 if all videos were processed successfully)
+    """
+    from tqdm import tqdm
 
-    # Parse video IDs
+    from cdvl_crawler.downloader import (
+        DEFAULT_CHUNK_SIZE,
+        DEFAULT_SEGMENTS,
+        CDVLDownloader,
+    )
+    from cdvl_crawler.utils import (
+        create_connector,
+        parse_video_ids,
+        require_license_acceptance,
+    )
+
+    # Validate all arguments before prompting, connecting or logging in
     try:
-        video_ids = [int(id.strip()) for id in args.video_ids.split(",")]
-        if not all(vid > 0 for vid in video_ids):
-            logger.error("Video IDs must be positive integers")
-            sys.exit(1)
-    except ValueError:
-        logger.error(
-            "Invalid video ID format. Use comma-separated integers (e.g., 1,5,10)"
-        )
-        sys.exit(1)
+        video_ids = parse_video_ids(args.video_ids)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+
+    # Drop duplicate IDs (keeping the first occurrence) to skip redundant fetches
+    video_ids = list(dict.fromkeys(video_ids))
 
     # Validate output parameter
     if args.output and len(video_ids) > 1:
         logger.error("--output can only be used with a single video ID")
-        sys.exit(1)
+        return 1
 
-    # Download all selected videos
-    downloader = CDVLDownloader(config_path=args.config, output_dir=args.output_dir)
-    await downloader._init_session()
+    # Compare with None: an explicit 0 must be rejected, not replaced by the default
+    max_concurrent = 3 if args.max_concurrent is None else args.max_concurrent
+    if max_concurrent < 1:
+        logger.error("--max-concurrent must be a positive integer")
+        return 1
 
-    try:
-        # Login once for all downloads
-        if not await downloader._login():
+    segments = DEFAULT_SEGMENTS if args.segments is None else args.segments
+    if segments < 1:
+        logger.error("--segments must be a positive integer")
+        return 1
+
+    # Loop invariants for the download tasks below
+    total = len(video_ids)
+    output_path = args.output if total == 1 else None
+
+    # Check license acceptance
+    if not require_license_acceptance(auto_accept=args.accept_license):
+        logger.error("License agreement not accepted. Exiting.")
+        return 1
+
+    # Download all selected videos, sizing the connection pool to match
+    downloader = CDVLDownloader(
+        config_path=args.config,
+        output_dir=args.output_dir,
+        connector=create_connector(max_concurrent * segments),
+    )
+
+    async with downloader:
+        # Login once for all downloads (also needed for --dry-run: download
+        # links are generated server-side per session and cannot be built
+        # offline); meanwhile, open the extra pooled connections that parallel
+        # downloads will need
+        logged_in, _ = await asyncio.gather(
+            downloader._login(),
+            downloader._warm_connections(min(max_concurrent, total) - 1),
+        )
+        if not logged_in:
             logger.error("Login failed. Exiting.")
-            sys.exit(1)
+            return 1
 
-        print(f"\nDownloading {len(video_ids)} video(s)...\n")
+        print(f"\nDownloading {total} video(s)...\n")
 
-        success_count = 0
-        for i, video_id in enumerate(video_ids, 1):
-            print(f"\n[{i}/{len(video_ids)}] Processing video ID {video_id}...")
+        async def process_video(index: int, video_id: int) -> bool:
+            # tqdm.write keeps lines from concurrent tasks intact and
+            # redraws any active progress bars below them
+            tqdm.write(f"\n[{index}/{total}] Processing video ID {video_id}...")
 
             # Get download link
             download_url = await downloader.get_download_link(video_id)
             if not download_url:
                 logger.error(f"Failed to get download link for video {video_id}")
-                continue
+                return False
 
             if args.dry_run:
                 # Just print the URL
-                print(f"Video {video_id}: {download_url}")
-                success_count += 1
-            else:
-                # Download the file
-                success = await downloader.download_file(
-                    download_url,
-                    output_path=args.output if len(video_ids) == 1 else None,
-                    video_id=video_id,
-                    enable_resume=not args.no_resume,
-                )
-                if success:
-                    success_count += 1
-
-        print(f"\n✓ Successfully processed {success_count}/{len(video_ids)} video(s)")
-        sys.exit(0 if success_count == len(video_ids) else 1)
-
-    finally:
-        await downloader._close_session()
+                tqdm.write(f"Video {video_id}: {download_url}")
+                return True
+
+            # Download the file
+            return await downloader.download_file(
+                download_url,
+                output_path=output_path,
+                video_id=video_id,
+                enable_resume=not args.no_resume,
+                chunk_size=DEFAULT_CHUNK_SIZE,
+                segments=segments,
+            )
+
+        # A fixed pool of workers takes the next ID as soon as it is done with
+        # one, so a slow video never holds up the others (unlike fixed
+        # batches) and long ID lists don't create all tasks upfront
+        pending_ids = enumerate(video_ids, 1)
+
+        async def worker() -> int:
+            succeeded = 0
+            for index, video_id in pending_ids:
+                try:
+                    if await process_video(index, video_id):
+                        succeeded += 1
+                except Exception as e:
+                    logger.error(f"Video {video_id}: Error - {e}")
+            return succeeded
+
+        counts = await asyncio.gather(
+            *(worker() for _ in range(min(max_concurrent, total)))
+        )
+        success_count = sum(counts)
+
+        print(f"\n✓ Successfully processed {success_count}/{total} video(s)")
+        return 0 if success_count == total else 1
 
 
 def run_generator(args):
     """Run the static site generator"""
+    from cdvl_crawler.generator import CDVLSiteGenerator
+
     generator = CDVLSiteGenerator(input_file=args.input, output_file=args.output)
 
     if generator.generate():
-        print(f"\n✓ Static site generated successfully: {args.output}")
-        print("  Open the file in your browser to view the video library")
+        print(
+            f"\n✓ Static site generated successfully: {args.output}\n"
+            "  Open the file in your browser to view the video library"
+        )
         sys.exit(0)
     else:
         logger.error("Failed to generate static site")
@@ -354,6 +499,8 @@ def run_generator(args):
 
 def run_exporter(args):
     """Run the CSV exporter"""
+    from cdvl_crawler.exporter import CDVLExporter
+
     # Parse columns if provided
     columns = None
     if args.columns:
@@ -8,13 +8,18 @@ import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from threading import Lock
-from typing import Any, Dict, Literal, Optional, cast
+from typing import IO, Any, Awaitable, Callable, Dict, Literal, Optional, Union, cast
 
 import aiohttp
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:  # optional, installed with the "speed" extra
+    orjson = None
+
 from cdvl_crawler.types import (
     DatasetData,
     LinkDict,
@@ -31,6 +36,86 @@ from cdvl_crawler.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Resume reads this much of a JSONL file's tail, doubling up to the maximum
+_TAIL_BLOCK_BYTES = 64 * 1024
+_TAIL_MAX_BYTES = 1024 * 1024
+
+_CONTENT_SELECTOR = "body > div.main-container.container-fluid > div > div"
+
+# _CONTENT_SELECTOR as XPath
+_CONTENT_DIV_XPATH = etree.XPath(
+    "/html/body/div"
+    "[contains(concat(' ', normalize-space(@class), ' '), ' main-container ')]"
+    "[contains(concat(' ', normalize-space(@class), ' '), ' container-fluid ')]"
+    "/div/div"
+)
+
+# Text nodes below an element, skipping script/style/template contents and
+# comments (matching what BeautifulSoup's get_text() returns)
+_TEXT_XPATH = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False,
+)
+
+# Pages are UTF-8; parsing bytes with a fixed encoding skips decoding in Python
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+# Anchors that have an href attribute, in document order
+_LINKS_XPATH = etree.XPath(".//a[@href]")
+
+_HEADER_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+_MEDIA_TAGS = ("img", "video", "source")
+_SIZE_PREFIX = "Size of upload video:"
+_DOWNLOAD_PREFIX = "Download "
+
+
+if orjson is not None:
+    _loads_json: Callable[[bytes], Any] = orjson.loads
+
+    def _json_line(record: Dict[str, Any]) -> bytes:
+        """Serialize a record as one UTF-8 encoded JSONL line"""
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+
+else:
+    _loads_json = json.loads
+
+    def _json_line(record: Dict[str, Any]) -> bytes:
+        """Serialize a record as one UTF-8 encoded JSONL line"""
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        return (line + "\n").encode("utf-8")
+
+
+def _id_from_json_line(line: bytes) -> Optional[int]:
+    """Return the ``id`` of a JSONL record, or None for blank or invalid lines"""
+    if not line.strip():
+        return None
+    try:
+        data = _loads_json(line)
+    except json.JSONDecodeError:
+        return None
+    if isinstance(data, dict) and "id" in data:
+        return data["id"]
+    return None
+
+
+def _decode_body(body: bytes, charset: Optional[str]) -> Union[str, bytes]:
+    """Return a response body ready for ``_parse_content``
+
+    UTF-8 (or unlabelled) bodies are passed through as bytes for lxml to decode;
+    anything else is decoded here using the charset from the response headers.
+    """
+    if charset is None or charset.lower().replace("_", "-") in ("utf-8", "utf8"):
+        return body
+    return body.decode(charset, errors="replace")
+
+
+def _get_text(element: Any) -> str:
+    """Concatenate an element's stripped text fragments, skipping empty ones
+
+    Equivalent to BeautifulSoup's ``get_text(strip=True)``.
+    """
+    return "".join(t.strip() for t in _TEXT_XPATH(element) if t.strip())
+
 
 class CDVLCrawler:
     """Crawler for CDVL videos and datasets"""
@@ -55,8 +140,6 @@ class CDVLCrawler:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.session: Optional[aiohttp.ClientSession] = None
-        self.video_lock = Lock()
-        self.dataset_lock = Lock()
 
         # Progress bars
         self.video_pbar: Optional[tqdm] = None
@@ -94,22 +177,37 @@ class CDVLCrawler:
         return await login_to_cdvl(self.session, username, password)
 
     def _parse_content(
-        self, html: str, content_type: Literal["video", "dataset"]
+        self, html: Union[str, bytes], content_type: Literal["video", "dataset"]
     ) -> Optional[PartialContentData]:
-        """Parse HTML content and extract structured data"""
+        """Parse HTML (str or UTF-8 bytes) and extract structured data"""
         try:
-            soup = BeautifulSoup(html, "lxml")
+            if isinstance(html, bytes):
+                # Cheap substring check for markup that any useful page must
+                # contain, so empty and error pages skip building a tree at all
+                if b"main-container" not in html:
+                    return None
+                root = lxml_html.document_fromstring(html, parser=_UTF8_HTML_PARSER)
+            else:
+                if "main-container" not in html:
+                    return None
+                try:
+                    root = lxml_html.document_fromstring(html)
+                except ValueError:
+                    # lxml rejects str input with an XML encoding declaration
+                    root = lxml_html.document_fromstring(
+                        html.encode("utf-8"), parser=_UTF8_HTML_PARSER
+                    )
 
             # Find the main content div
-            selector = "body > div.main-container.container-fluid > div > div"
-            content_div = soup.select_one(selector)
+            matches = _CONTENT_DIV_XPATH(root)
+            content_div = matches[0] if matches else None
 
-            if not content_div:
-                logger.debug(f"No content found for selector: {selector}")
+            if content_div is None:
+                logger.debug(f"No content found for selector: {_CONTENT_SELECTOR}")
                 return None
 
             # Check if content is empty or minimal
-            text_content = content_div.get_text(strip=True)
+            text_content = _get_text(content_div)
             if not text_content or len(text_content) < 10:
                 return None
 
@@ -120,12 +218,22 @@ class CDVLCrawler:
             ):
                 return None
 
-            # Extract all paragraphs (required field)
-            paragraphs = [
-                p.get_text(strip=True)
-                for p in content_div.find_all("p")
-                if p.get_text(strip=True)
-            ]
+            # Extract all paragraphs (required field) and, in the same pass,
+            # the file size from the first "Size of upload video:" paragraph
+            paragraphs: list[str] = []
+            file_size = ""
+            size_found = False
+            for p in content_div.iter("p"):
+                p_text = _get_text(p)
+                if p_text:
+                    paragraphs.append(p_text)
+                if size_found:
+                    continue
+                strong = p.find(".//strong")
+                if strong is not None and _SIZE_PREFIX in "".join(_TEXT_XPATH(strong)):
+                    size_found = True
+                    # Remove the "Size of upload video:" prefix
+                    file_size = p_text.replace(_SIZE_PREFIX, "").strip()
 
             # Return None if no paragraphs found (no useful content)
             if not paragraphs:
@@ -141,8 +249,8 @@ class CDVLCrawler:
             # Try to extract more specific fields
             # Title - find first non-empty header
             title_text = ""
-            for header in content_div.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
-                title_text = header.get_text(strip=True)
+            for header in content_div.iter(*_HEADER_TAGS):
+                title_text = _get_text(header)
                 if title_text:  # Skip empty headers
                     break
             if title_text:
@@ -150,49 +258,38 @@ class CDVLCrawler:
 
             # All links
             links: list[LinkDict] = []
-            for a in content_div.find_all("a", href=True):
-                href = a["href"]
-                # BeautifulSoup can return str or list, ensure we get a string
-                href_str = href if isinstance(href, str) else " ".join(href)
-                link: LinkDict = {"text": a.get_text(strip=True), "href": href_str}
+            for a in _LINKS_XPATH(content_div):
+                link: LinkDict = {"text": _get_text(a), "href": a.get("href")}
                 links.append(link)
             if links:
                 data["links"] = links
 
             # Tables (if any)
-            tables = content_div.find_all("table")
-            if tables:
-                data["tables_count"] = len(tables)
+            tables_count = sum(1 for _ in content_div.iter("table"))
+            if tables_count:
+                data["tables_count"] = tables_count
 
             # Images/videos
             media: list[MediaDict] = []
-            for tag in content_div.find_all(["img", "video", "source"]):
+            for tag in content_div.iter(*_MEDIA_TAGS):
                 src = tag.get("src")
                 if src:
-                    # BeautifulSoup can return str or list, ensure we get a string
-                    src_str = src if isinstance(src, str) else " ".join(src)
-                    media_item: MediaDict = {"type": tag.name, "src": src_str}
+                    media_item: MediaDict = {"type": tag.tag, "src": src}
                     media.append(media_item)
             if media:
                 data["media"] = media
 
-            # File size - look for "Size of upload video:" pattern
-            for p in content_div.find_all("p"):
-                strong = p.find("strong")
-                if strong and "Size of upload video:" in strong.get_text():
-                    # Extract text after the strong tag
-                    size_text = p.get_text(strip=True)
-                    # Remove the "Size of upload video:" prefix
-                    size_text = size_text.replace("Size of upload video:", "").strip()
-                    if size_text:
-                        data["file_size"] = size_text
-                    break
+            # File size
+            if file_size:
+                data["file_size"] = file_size
 
             # Filename - look for download button
-            for button in content_div.find_all("button", class_="btn"):
-                button_text = button.get_text(strip=True)
-                if button_text.startswith("Download "):
-                    filename = button_text.replace("Download ", "").strip()
+            for button in content_div.iter("button"):
+                if "btn" not in (button.get("class") or "").split():
+                    continue
+                button_text = _get_text(button)
+                if button_text.startswith(_DOWNLOAD_PREFIX):
+                    filename = button_text.replace(_DOWNLOAD_PREFIX, "").strip()
                     if filename:
                         data["filename"] = filename
                     break
@@ -204,34 +301,62 @@ class CDVLCrawler:
             return None
 
     def _get_last_id_from_jsonl(self, filepath: str) -> int:
-        """Get the last ID from a JSONL file"""
+        """Get the last ID from a JSONL file
+
+        Records are appended in ascending ID order, so the last valid line holds
+        the highest ID. Only the tail of the file is read, growing the window up
+        to ``_TAIL_MAX_BYTES`` before falling back to a full scan.
+        """
         try:
             if not Path(filepath).exists():
                 return 0
 
-            last_id = 0
-            with open(filepath, "r", encoding="utf-8") as f:
+            with open(filepath, "rb") as f:
+                size = f.seek(0, 2)
+                block = _TAIL_BLOCK_BYTES
+                while True:
+                    offset = max(0, size - block)
+                    f.seek(offset)
+                    lines = f.read().split(b"\n")
+                    if offset > 0:
+                        # The first line is probably cut off
+                        lines = lines[1:]
+                    for line in reversed(lines):
+                        last_id = _id_from_json_line(line)
+                        if last_id is not None:
+                            return last_id
+                    if offset == 0 or block >= _TAIL_MAX_BYTES:
+                        break
+                    block *= 2
+
+                if offset == 0:
+                    return 0
+
+                # No valid record near the end, scan the whole file
+                last_id = 0
+                f.seek(0)
                 for line in f:
-                    try:
-                        data = json.loads(line)
-                        if "id" in data:
-                            last_id = max(last_id, data["id"])
-                    except json.JSONDecodeError:
-                        continue
-
-            return last_id
+                    line_id = _id_from_json_line(line)
+                    if line_id is not None:
+                        last_id = max(last_id, line_id)
+                return last_id
         except Exception as e:
             logger.warning(f"Error reading last ID from {filepath}: {e}")
             return 0
 
-    def _append_to_jsonl(self, filepath: str, data: Dict[str, Any], lock: Lock):
-        """Append data to JSONL file atomically"""
+    def _write_jsonl(self, fh: IO[bytes], records: list[Dict[str, Any]]) -> None:
+        """Append records to an open JSONL file with a single write and flush
+
+        Each crawler writes its own file from a single task, so no locking is
+        needed; flushing after every batch keeps the file usable for resume.
+        """
+        if not records:
+            return
         try:
-            with lock:
-                with open(filepath, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(data, ensure_ascii=False) + "\n")
+            fh.write(b"".join(map(_json_line, records)))
+            fh.flush()
         except Exception as e:
-            logger.error(f"Error writing to {filepath}: {e}")
+            logger.error(f"Error writing to {fh.name}: {e}")
 
     async def _fetch_video(self, video_id: int) -> Optional[VideoData]:
         """Fetch a single video by ID"""
@@ -247,17 +372,21 @@ class CDVLCrawler:
                     logger.debug(f"Video {video_id}: HTTP {response.status}")
                     return None
 
-                html = await response.text()
-                partial_data = self._parse_content(html, "video")
+                # Read raw bytes, skipping aiohttp's charset detection
+                html = _decode_body(await response.read(), response.charset)
 
-                if partial_data:
-                    # Convert to dict, add id and url, then cast to VideoData
-                    complete_data = dict(partial_data)
-                    complete_data["id"] = video_id
-                    complete_data["url"] = url
-                    return cast(VideoData, complete_data)
-                else:
-                    return None
+            # Parse in a worker thread (after releasing the connection) so the
+            # event loop keeps serving other requests; lxml releases the GIL
+            partial_data = await asyncio.to_thread(self._parse_content, html, "video")
+
+            if partial_data:
+                # Convert to dict, add id and url, then cast to VideoData
+                complete_data = dict(partial_data)
+                complete_data["id"] = video_id
+                complete_data["url"] = url
+                return cast(VideoData, complete_data)
+            else:
+                return None
 
         except asyncio.TimeoutError:
             logger.warning(f"Video {video_id}: Timeout")
@@ -280,17 +409,21 @@ class CDVLCrawler:
                     logger.debug(f"Dataset {dataset_id}: HTTP {response.status}")
                     return None
 
-                html = await response.text()
-                partial_data = self._parse_content(html, "dataset")
+                # Read raw bytes, skipping aiohttp's charset detection
+                html = _decode_body(await response.read(), response.charset)
 
-                if partial_data:
-                    # Convert to dict, add id and url, then cast to DatasetData
-                    complete_data = dict(partial_data)
-                    complete_data["id"] = dataset_id
-                    complete_data["url"] = url
-                    return cast(DatasetData, complete_data)
-                else:
-                    return None
+            # Parse in a worker thread (after releasing the connection) so the
+            # event loop keeps serving other requests; lxml releases the GIL
+            partial_data = await asyncio.to_thread(self._parse_content, html, "dataset")
+
+            if partial_data:
+                # Convert to dict, add id and url, then cast to DatasetData
+                complete_data = dict(partial_data)
+                complete_data["id"] = dataset_id
+                complete_data["url"] = url
+                return cast(DatasetData, complete_data)
+            else:
+                return None
 
         except asyncio.TimeoutError:
             logger.warning(f"Dataset {dataset_id}: Timeout")
@@ -299,165 +432,214 @@ class CDVLCrawler:
             logger.error(f"Dataset {dataset_id}: Error - {e}")
             return None
 
-    async def _crawl_videos(self, start_id: int = 1, max_concurrent: int = 5):
-        """Crawl all videos with parallel requests and sequential scanning"""
-        logger.info("Starting video crawler...")
-        output_file = str(self.output_dir / self.config["output"]["videos_file"])
-        consecutive_failures = 0
-        max_failures = self.config.get("max_consecutive_failures", 1000)
-        max_video_id = self.config.get("max_video_id")
-
-        current_id = start_id
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        # Create progress bar
-        self.video_pbar = tqdm(
-            desc="Videos", unit="video", position=0, leave=True, dynamic_ncols=True
-        )
-
-        async def fetch_with_semaphore(vid_id):
-            async with semaphore:
-                return await self._fetch_video(vid_id)
-
-        try:
-            while True:
-                # Check if we've hit the consecutive failures limit
-                if consecutive_failures >= max_failures:
-                    logger.info(
-                        f"No videos found after {consecutive_failures} consecutive attempts. Stopping."
-                    )
-                    break
-
-                # Determine batch size, respecting max_video_id if set
-                batch_size = max_concurrent
-                if max_video_id is not None:
-                    # Don't go beyond max_video_id
-                    if current_id > max_video_id:
-                        logger.info(f"Reached max_video_id limit: {max_video_id}")
-                        break
-                    # Adjust batch size if we're near the limit
-                    batch_size = min(batch_size, max_video_id - current_id + 1)
-
-                # Fetch batch
-                tasks = [
-                    fetch_with_semaphore(current_id + i) for i in range(batch_size)
-                ]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Process results
-                for i, result in enumerate(results):
-                    if isinstance(result, (Exception, BaseException)):
-                        self.stats["videos"]["failed"] += 1
-                        consecutive_failures += 1
-                    elif result is None:
-                        self.stats["videos"]["empty"] += 1
-                        consecutive_failures += 1
-                    elif isinstance(result, dict):
-                        # Success!
-                        self._append_to_jsonl(output_file, result, self.video_lock)
-                        self.stats["videos"]["success"] += 1
-                        consecutive_failures = 0  # Reset on success
-                    else:
-                        # Unexpected result type
-                        self.stats["videos"]["failed"] += 1
-                        consecutive_failures += 1
-
-                    # Update progress bar
-                    self.video_pbar.update(1)
-                    self.video_pbar.set_postfix(
-                        success=self.stats["videos"]["success"],
-                        empty=self.stats["videos"]["empty"],
-                        failed=self.stats["videos"]["failed"],
-                    )
-
-                current_id += batch_size
+    async def _probe_ahead(
+        self,
+        fetch: Callable[[int], Awaitable[Any]],
+        last_id: int,
+        step: int,
+        attempts: int,
+        max_id: Optional[int],
+        batch_size: int,
+    ) -> Optional[int]:
+        """Probe every ``step``-th ID after ``last_id`` for content
 
-                # Add small delay to be respectful
-                await asyncio.sleep(self.config.get("request_delay", 0.1))
+        Args:
+            fetch: Coroutine function fetching a single ID
+            last_id: Last ID that was scanned
+            step: Distance between probed IDs
+            attempts: Number of IDs to probe
+            max_id: Optional maximum ID to probe
+            batch_size: Number of probes to run at once
+
+        Returns:
+            First probed ID that has content, or None if none has
+        """
+        probe_ids = [last_id + step * k for k in range(1, attempts + 1)]
+        if max_id is not None:
+            probe_ids = [i for i in probe_ids if i <= max_id]
+
+        for start in range(0, len(probe_ids), batch_size):
+            batch = probe_ids[start : start + batch_size]
+            results = await asyncio.gather(
+                *(fetch(i) for i in batch), return_exceptions=True
+            )
+            for probe_id, result in zip(batch, results):
+                if isinstance(result, dict):
+                    return probe_id
+        return None
 
-        finally:
-            if self.video_pbar is not None:
-                self.video_pbar.close()
+    async def _crawl_content(
+        self,
+        content_type: Literal["video", "dataset"],
+        start_id: int,
+        semaphore: asyncio.Semaphore,
+    ):
+        """Crawl all videos or datasets with parallel requests and sequential scanning
 
-    async def _crawl_datasets(self, start_id: int = 1, max_concurrent: int = 5):
-        """Crawl all datasets with parallel requests and sequential scanning"""
-        logger.info("Starting dataset crawler...")
-        output_file = str(self.output_dir / self.config["output"]["datasets_file"])
+        Args:
+            content_type: Either "video" or "dataset"
+            start_id: First ID to fetch
+            semaphore: Limits concurrent requests, shared by both content types
+        """
+        plural = f"{content_type}s"
+        logger.info(f"Starting {content_type} crawler...")
+        output_file = str(self.output_dir / self.config["output"][f"{plural}_file"])
         consecutive_failures = 0
         max_failures = self.config.get("max_consecutive_failures", 1000)
-        max_dataset_id = self.config.get("max_dataset_id")
-
+        max_id_key = f"max_{content_type}_id"
+        max_id = self.config.get(max_id_key)
+        window = self.config.get("max_concurrent_requests", 5)
+        probe_step = self.config.get("probe_step", 100)
+        max_probe_attempts = self.config.get("max_probe_attempts", 20)
+        stats = self.stats[plural]
+
+        fetch = self._fetch_video if content_type == "video" else self._fetch_dataset
         current_id = start_id
-        semaphore = asyncio.Semaphore(max_concurrent)
 
         # Create progress bar
-        self.dataset_pbar = tqdm(
-            desc="Datasets", unit="dataset", position=1, leave=True, dynamic_ncols=True
+        pbar = tqdm(
+            desc=plural.capitalize(),
+            unit=content_type,
+            position=0 if content_type == "video" else 1,
+            leave=True,
+            dynamic_ncols=True,
+            mininterval=0.5,
         )
+        if content_type == "video":
+            self.video_pbar = pbar
+        else:
+            self.dataset_pbar = pbar
 
-        async def fetch_with_semaphore(ds_id):
+        request_delay = self.config.get("request_delay", 0.1)
+
+        async def fetch_with_semaphore(content_id):
             async with semaphore:
-                return await self._fetch_dataset(ds_id)
+                try:
+                    return await fetch(content_id)
+                finally:
+                    # Add small delay to be respectful
+                    await asyncio.sleep(request_delay)
+
+        # Fetches run in a sliding window: a new ID is started as soon as one
+        # finishes. Results are processed in ID order so that the output file
+        # stays sorted for resume.
+        in_flight: Dict[asyncio.Task, int] = {}
+        finished: Dict[int, Any] = {}
+        next_id = start_id
+
+        # After probe_step misses in a row, the scan pauses and probes IDs
+        # further ahead. If a probe finds content the scan carries on through
+        # the gap, at least up to that ID; otherwise the crawl stops early.
+        # With probing enabled this usually ends the scan well before
+        # max_failures; probe_step 0 scans until max_failures instead.
+        gap_probed = False
+        probed_until = 0
+
+        # Keep the output file open for the whole crawl
+        output_fh = open(output_file, "ab")
 
         try:
             while True:
-                # Check if we've hit the consecutive failures limit
-                if consecutive_failures >= max_failures:
-                    logger.info(
-                        f"No datasets found after {consecutive_failures} consecutive attempts. Stopping."
+                if (
+                    not in_flight
+                    and not gap_probed
+                    and probe_step > 0
+                    and probe_step <= consecutive_failures < max_failures
+                ):
+                    gap_probed = True
+                    last_scanned = next_id - 1
+                    hit = await self._probe_ahead(
+                        fetch_with_semaphore,
+                        last_scanned,
+                        probe_step,
+                        max_probe_attempts,
+                        max_id,
+                        window,
                     )
-                    break
-
-                # Determine batch size, respecting max_dataset_id if set
-                batch_size = max_concurrent
-                if max_dataset_id is not None:
-                    # Don't go beyond max_dataset_id
-                    if current_id > max_dataset_id:
-                        logger.info(f"Reached max_dataset_id limit: {max_dataset_id}")
+                    if hit is None:
+                        logger.info(
+                            f"No {plural} found within {probe_step * max_probe_attempts} IDs after {last_scanned}. Stopping."
+                        )
                         break
-                    # Adjust batch size if we're near the limit
-                    batch_size = min(batch_size, max_dataset_id - current_id + 1)
-
-                # Fetch batch
-                tasks = [
-                    fetch_with_semaphore(current_id + i) for i in range(batch_size)
-                ]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+                    logger.debug(f"Probe found {content_type} {hit}, continuing scan")
+                    probed_until = hit
+
+                # Fill the window until the failure or ID limit is reached
+                while (
+                    len(in_flight) < window
+                    and (
+                        consecutive_failures < max_failures
+                        or current_id <= probed_until
+                    )
+                    and (
+                        probe_step <= 0
+                        or consecutive_failures < probe_step
+                        or gap_probed
+                    )
+                    and (max_id is None or current_id <= max_id)
+                ):
+                    task = asyncio.ensure_future(fetch_with_semaphore(current_id))
+                    in_flight[task] = current_id
+                    current_id += 1
+
+                if not in_flight:
+                    if consecutive_failures >= max_failures:
+                        logger.info(
+                            f"No {plural} found after {consecutive_failures} consecutive attempts. Stopping."
+                        )
+                    else:
+                        logger.info(f"Reached {max_id_key} limit: {max_id}")
+                    break
 
-                # Process results
-                for i, result in enumerate(results):
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    content_id = in_flight.pop(task)
+                    finished[content_id] = task.exception() or task.result()
+
+                # Process results that are next in ID order
+                new_records: list[Dict[str, Any]] = []
+                processed = 0
+                while next_id in finished:
+                    result = finished.pop(next_id)
+                    next_id += 1
                     if isinstance(result, (Exception, BaseException)):
-                        self.stats["datasets"]["failed"] += 1
+                        stats["failed"] += 1
                         consecutive_failures += 1
                     elif result is None:
-                        self.stats["datasets"]["empty"] += 1
+                        stats["empty"] += 1
                         consecutive_failures += 1
                     elif isinstance(result, dict):
                         # Success!
-                        self._append_to_jsonl(output_file, result, self.dataset_lock)
-                        self.stats["datasets"]["success"] += 1
+                        new_records.append(result)
+                        stats["success"] += 1
                         consecutive_failures = 0  # Reset on success
+                        gap_probed = False
                     else:
                         # Unexpected result type
-                        self.stats["datasets"]["failed"] += 1
+                        stats["failed"] += 1
                         consecutive_failures += 1
-
-                    # Update progress bar
-                    self.dataset_pbar.update(1)
-                    self.dataset_pbar.set_postfix(
-                        success=self.stats["datasets"]["success"],
-                        empty=self.stats["datasets"]["empty"],
-                        failed=self.stats["datasets"]["failed"],
+                    processed += 1
+
+                # Update progress bar once per drained run; tqdm redraws at
+                # most every mininterval seconds
+                if processed:
+                    pbar.set_postfix(
+                        success=stats["success"],
+                        empty=stats["empty"],
+                        failed=stats["failed"],
+                        refresh=False,
                     )
+                    pbar.update(processed)
 
-                current_id += batch_size
-
-                # Add small delay to be respectful
-                await asyncio.sleep(self.config.get("request_delay", 0.1))
+                self._write_jsonl(output_fh, new_records)
 
         finally:
-            if self.dataset_pbar is not None:
-                self.dataset_pbar.close()
+            for task in in_flight:
+                task.cancel()
+            output_fh.close()
+            pbar.close()
 
     async def crawl(self):
         """Main crawl function - runs both crawlers in parallel"""
@@ -499,12 +681,14 @@ class CDVLCrawler:
                     f"Resuming dataset crawl from ID {start_dataset_id} (last: {last_dataset_id})"
                 )
 
-            max_concurrent = self.config.get("max_concurrent_requests", 5)
+            # One semaphore for both crawlers keeps the total number of
+            # requests in flight at max_concurrent_requests
+            semaphore = asyncio.Semaphore(self.config.get("max_concurrent_requests", 5))
 
             logger.info("Starting crawlers in parallel...")
             await asyncio.gather(
-                self._crawl_videos(start_video_id, max_concurrent),
-                self._crawl_datasets(start_dataset_id, max_concurrent),
+                self._crawl_content("video", start_video_id, semaphore),
+                self._crawl_content("dataset", start_dataset_id, semaphore),
             )
 
             logger.info("\n" + "=" * 60)
@@ -3,15 +3,19 @@ CDVL Video Downloader
 Downloads individual videos from cdvl.org by ID or comma-separated IDs
 """
 
+import asyncio
 import json
 import logging
+import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional
 
 import aiohttp
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from tqdm import tqdm
+from yarl import URL
 
 from cdvl_crawler.utils import (
     create_session,
@@ -23,21 +27,165 @@ from cdvl_crawler.utils import (
 
 logger = logging.getLogger(__name__)
 
+# CDVL pages are UTF-8; parsing their bytes directly skips decoding in Python
+_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+# First form with a button whose text contains "download manager link",
+# compared case-insensitively
+_DOWNLOAD_FORM_XPATH = etree.XPath(
+    "(//form[.//button[contains("
+    "translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), "
+    "'download manager link')]])[1]"
+)
+
+# soup.find("table", {"class": "downloadTable"}) as XPath
+_DOWNLOAD_TABLE_XPATH = etree.XPath(
+    "//table[contains(concat(' ', normalize-space(@class), ' '), ' downloadTable ')]"
+)
+
+# Default read size when streaming downloads to disk
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+# Video files are already compressed; asking for them unencoded avoids a
+# pointless decompression pass and keeps byte ranges relative to the file
+# itself rather than to a compressed representation of it
+_DOWNLOAD_HEADERS = {"Accept-Encoding": "identity"}
+
+# Default number of parallel range requests per download
+DEFAULT_SEGMENTS = 4
+
+# Files are only split into segments of at least this size
+MIN_SEGMENT_SIZE = 16 * 1024 * 1024  # 16 MB
+
+
+def _stripped_text(element: Any) -> str:
+    """Join an element's stripped text fragments, like ``get_text(strip=True)``"""
+    return "".join(t.strip() for t in element.itertext())
+
+
+def _content_range_total(content_range: str) -> Optional[int]:
+    """Return the total size from a ``Content-Range: bytes start-end/total`` value
+
+    Returns None if the header is missing, malformed or the total is unknown (*).
+    """
+    total_str = content_range.rpartition("/")[2].strip()
+    if not total_str.isdigit():
+        return None
+    return int(total_str)
+
+
+def _if_range_validator(
+    etag: Optional[str], last_modified: Optional[str]
+) -> Optional[str]:
+    """Return the value to send as ``If-Range`` for a version of a file
+
+    This is the strong ETag, or Last-Modified if there is none; weak ETags
+    cannot be used with If-Range.
+    """
+    if etag and not etag.startswith("W/"):
+        return etag
+    return last_modified
+
+
+def _preallocate(f: BinaryIO, size: int) -> None:
+    """Reserve ``size`` bytes on disk for the file ``f``
+
+    Uses ``posix_fallocate`` so the filesystem can allocate the file in few
+    extents up front instead of growing it write by write; where that is not
+    available, the file is extended sparsely.
+    """
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError as e:
+            logger.debug(f"posix_fallocate failed, extending sparsely: {e}")
+    f.truncate(size)
+
+
+async def _stream_to_file(
+    content: aiohttp.StreamReader,
+    f: BinaryIO,
+    chunk_size: int,
+    pbar: tqdm,
+    limit: Optional[int] = None,
+) -> None:
+    """Copy ``content`` to ``f`` until EOF or until ``limit`` bytes were copied
+
+    Writes run in a worker thread so that a slow disk does not block the event
+    loop (and every other download on it), and the next chunk is read from the
+    network while the previous one is being written. When this returns or
+    raises, no write is pending and ``f.tell()`` is the end of the data written.
+    """
+    remaining = limit
+    write: Optional[asyncio.Future[int]] = None
+    try:
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            chunk = await content.read(size)
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            if write is not None:
+                # Shielded: a cancelled download must not abandon a running write
+                pbar.update(await asyncio.shield(write))
+            write = asyncio.ensure_future(asyncio.to_thread(f.write, chunk))
+    finally:
+        if write is not None:
+            pbar.update(await asyncio.shield(write))
+
+
+def _split_ranges(total_size: int, segments: int) -> list[tuple[int, int]]:
+    """Split ``total_size`` bytes into contiguous inclusive byte ranges
+
+    At most ``segments`` ranges are returned, each at least ``MIN_SEGMENT_SIZE``
+    bytes long (a single range covers files that are too small to split).
+    """
+    count = max(1, min(segments, total_size // MIN_SEGMENT_SIZE))
+    bounds = [i * total_size // count for i in range(count + 1)]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(count)]
+
 
 class CDVLDownloader:
     """Download individual videos from CDVL"""
 
-    def __init__(self, config_path: Optional[str] = None, output_dir: str = "."):
-        """Initialize downloader with configuration"""
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        output_dir: str = ".",
+        connector: Optional[aiohttp.TCPConnector] = None,
+    ):
+        """Initialize downloader with configuration
+
+        Args:
+            config_path: Optional path to config file
+            output_dir: Directory for downloaded files (default: current directory)
+            connector: Optional connector shared by the login and all downloads
+                (default: a keep-alive connector sized from the config)
+        """
         self.config = load_config(config_path)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.connector = connector
         self.session: Optional[aiohttp.ClientSession] = None
 
-    async def _init_session(self):
-        """Initialize aiohttp session"""
+    async def _init_session(self, connector: Optional[aiohttp.TCPConnector] = None):
+        """Initialize aiohttp session
+
+        The session (and its keep-alive connection pool) is meant to be reused
+        for every video handled by this downloader.
+
+        Args:
+            connector: Optional connector to use instead of the one given to
+                the constructor (or the default one)
+        """
         if self.session is None:
-            self.session = await create_session(self.config, timeout_seconds=300)
+            self.session = await create_session(
+                self.config,
+                timeout_seconds=300,
+                connector=connector or self.connector,
+            )
 
     async def _close_session(self):
         """Close aiohttp session"""
@@ -45,6 +193,15 @@ class CDVLDownloader:
             await self.session.close()
             self.session = None
 
+    async def __aenter__(self) -> "CDVLDownloader":
+        """Initialize the session when entering an ``async with`` block"""
+        await self._init_session()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the session when leaving an ``async with`` block"""
+        await self._close_session()
+
     async def _login(self) -> bool:
         """Perform login to CDVL and establish session"""
         try:
@@ -59,63 +216,38 @@ class CDVLDownloader:
 
         return await login_to_cdvl(self.session, username, password)
 
-    async def _probe_range_support(self, url: str) -> tuple[bool, Optional[int]]:
-        """Check if server supports HTTP range requests.
+    async def _warm_connections(self, count: int) -> None:
+        """Open extra keep-alive connections to the CDVL host in the background.
 
-        Uses a GET request with Range header instead of HEAD, since some servers
-        (like CDVL) don't support HEAD requests for download URLs.
+        Meant to run alongside the login, so that the TCP/TLS handshakes for
+        parallel downloads overlap with the login round trips instead of
+        following them. The requests go through the shared connector but with
+        their own session and no cookie jar, so that their responses cannot
+        overwrite the antiforgery/session cookies the login depends on.
+        Failures are ignored; they only cost the warm-up.
 
-        Returns:
-            Tuple of (supports_ranges, content_length)
+        Args:
+            count: Number of connections to open
         """
-        if self.session is None:
-            return False, None
+        if self.session is None or count <= 0:
+            return
 
-        try:
-            # Use GET with Range: bytes=0-0 to probe for range support
-            # This requests just the first byte, which is efficient
-            headers = {"Range": "bytes=0-0"}
-            async with self.session.get(url, headers=headers) as response:
-                if response.status == 206:
-                    # Server supports range requests
-                    # Content-Range header format: "bytes 0-0/total_size"
-                    content_range = response.headers.get("Content-Range", "")
-                    content_length: Optional[int] = None
-                    if "/" in content_range:
-                        try:
-                            total_str = content_range.split("/")[-1]
-                            if total_str != "*":
-                                content_length = int(total_str)
-                        except ValueError:
-                            pass
-
-                    logger.debug(
-                        f"Range support: True (206), Content-Length: {content_length}"
-                    )
-                    # Consume the response body to allow connection reuse
-                    await response.read()
-                    return True, content_length
-
-                elif response.status == 200:
-                    # Server ignored the Range header, doesn't support ranges
-                    content_length_str = response.headers.get("Content-Length")
-                    content_length = (
-                        int(content_length_str) if content_length_str else None
-                    )
-                    logger.debug(
-                        f"Range support: False (200), Content-Length: {content_length}"
-                    )
-                    # Important: we need to NOT consume the full body here
-                    # Just close/cancel the response
-                    return False, content_length
+        origin = str(URL(self.config["endpoints"]["video_base_url"]).origin())
 
-                else:
-                    logger.debug(f"Range probe failed: HTTP {response.status}")
-                    return False, None
+        async with aiohttp.ClientSession(
+            connector=self.session.connector,
+            connector_owner=False,
+            cookie_jar=aiohttp.DummyCookieJar(),
+        ) as session:
 
-        except Exception as e:
-            logger.debug(f"Range probe error: {e}")
-            return False, None
+            async def warm_one() -> None:
+                try:
+                    async with session.head(origin, allow_redirects=False):
+                        pass
+                except Exception as e:
+                    logger.debug(f"Connection warm-up failed: {e}")
+
+            await asyncio.gather(*(warm_one() for _ in range(count)))
 
     def _save_partial_metadata(
         self,
@@ -123,15 +255,24 @@ class CDVLDownloader:
         video_id: int,
         content_length: Optional[int],
         filename: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
     ) -> None:
         """Save metadata for partial download validation."""
         metadata = {
             "video_id": video_id,
             "content_length": content_length,
             "filename": filename,
+            "etag": etag,
+            "last_modified": last_modified,
             "started_at": datetime.now(timezone.utc).isoformat(),
         }
-        meta_path.write_text(json.dumps(metadata, indent=2))
+        # Write to a temporary file and swap it in, so an interrupted write
+        # never leaves truncated metadata next to a resumable partial file
+        # (not with_suffix(".tmp"): that is the partial file of the same video)
+        tmp_path = meta_path.with_name(meta_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(metadata, indent=2))
+        os.replace(tmp_path, meta_path)
 
     def _load_partial_metadata(self, meta_path: Path) -> Optional[dict[str, Any]]:
         """Load partial download metadata.
@@ -215,49 +356,40 @@ class CDVLDownloader:
                     logger.error(f"Failed to fetch video page: HTTP {response.status}")
                     return None
 
-                html = await response.text()
-                soup = BeautifulSoup(html, "lxml")
+                root = lxml_html.document_fromstring(
+                    await response.read(), parser=_HTML_PARSER
+                )
 
                 # Find the download manager form
                 # Look for form with "generate a download manager link" button
-                forms = soup.find_all("form")
-                target_form = None
-
-                for form in forms:
-                    # Type ignore needed for BeautifulSoup's find method with lambda
-                    button = form.find(  # type: ignore[call-overload]
-                        "button",
-                        string=lambda text: text
-                        and "download manager link" in text.lower(),
-                    )
-                    if button:
-                        target_form = form
-                        break
-
-                if not target_form:
+                forms = _DOWNLOAD_FORM_XPATH(root)
+                if not forms:
                     logger.error("Could not find download manager form")
                     return None
+                target_form = forms[0]
 
                 # Extract form data
-                video_id_input = target_form.find("input", {"name": "videoId"})
-                dist_type_input = target_form.find(
-                    "input", {"name": "distributionType"}
-                )
+                video_id_input = target_form.find(".//input[@name='videoId']")
+                dist_type_input = target_form.find(".//input[@name='distributionType']")
                 token_input = target_form.find(
-                    "input", {"name": "__RequestVerificationToken"}
+                    ".//input[@name='__RequestVerificationToken']"
                 )
-                ufprt_input = target_form.find("input", {"name": "ufprt"})
+                ufprt_input = target_form.find(".//input[@name='ufprt']")
 
-                if not video_id_input or not token_input:
+                if video_id_input is None or token_input is None:
                     logger.error("Missing required form fields")
                     return None
 
                 video_id_value = video_id_input.get("value")
                 dist_type_value = (
-                    dist_type_input.get("value", "") if dist_type_input else ""
+                    dist_type_input.get("value", "")
+                    if dist_type_input is not None
+                    else ""
                 )
                 verification_token = token_input.get("value")
-                ufprt_token = ufprt_input.get("value") if ufprt_input else ""
+                ufprt_token = (
+                    ufprt_input.get("value", "") if ufprt_input is not None else ""
+                )
 
                 logger.info("Generating download link...")
 
@@ -278,29 +410,28 @@ class CDVLDownloader:
                     )
                     return None
 
-                html = await response.text()
-                soup = BeautifulSoup(html, "lxml")
+                root = lxml_html.document_fromstring(
+                    await response.read(), parser=_HTML_PARSER
+                )
 
                 # Find the download table
-                download_table = soup.find("table", {"class": "downloadTable"})
-                if not download_table:
+                tables = _DOWNLOAD_TABLE_XPATH(root)
+                if not tables:
                     logger.error("Download table not found in response")
                     return None
 
                 # Extract the download URL (from "Other" row)
-                rows = download_table.find_all("tr")
-                for row in rows:
-                    cells = row.find_all("td")
-                    if len(cells) >= 2 and "Other" in cells[0].get_text():
-                        download_url = cells[1].get_text(strip=True)
+                rows = [row.findall(".//td") for row in tables[0].iter("tr")]
+                for cells in rows:
+                    if len(cells) >= 2 and "Other" in cells[0].text_content():
+                        download_url = _stripped_text(cells[1])
                         logger.info(f"✓ Download link generated: {download_url}")
                         return download_url
 
                 # Fallback: try to find any GetFileDownload URL
-                for row in rows:
-                    cells = row.find_all("td")
+                for cells in rows:
                     for cell in cells:
-                        text = cell.get_text(strip=True)
+                        text = _stripped_text(cell)
                         if "GetFileDownload" in text:
                             # Extract URL from wget/curl command if needed
                             parts = text.split()
@@ -316,20 +447,122 @@ class CDVLDownloader:
             logger.error(f"Error getting download link: {e}")
             return None
 
+    async def _download_ranges(
+        self,
+        first_response: aiohttp.ClientResponse,
+        url: str,
+        partial_path: Path,
+        ranges: list[tuple[int, int]],
+        if_range: str,
+        pbar: tqdm,
+        chunk_size: int,
+        timeout: aiohttp.ClientTimeout,
+    ) -> int:
+        """Download byte ranges in parallel into a preallocated partial file
+
+        ``first_response`` must be a 206 response starting at offset 0, of which
+        only ``ranges[0]`` is read; the remaining ranges are requested here with
+        ``if_range`` (the first response's validator), so that each one must
+        come from the same version of the file. If any range fails, the others
+        are cancelled and the file is truncated to the completed prefix of the
+        first range, so that the download can resume from there.
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            Exception: If a range could not be downloaded completely
+        """
+        if self.session is None:
+            raise RuntimeError("Session not initialized")
+        session = self.session
+
+        # Preallocate so ranges can be written at their offsets in any order
+        total = ranges[-1][1] + 1
+        with open(partial_path, "wb") as f:
+            _preallocate(f, total)
+
+        written = [0] * len(ranges)
+
+        async def write_range(index: int, response: aiohttp.ClientResponse) -> None:
+            start, end = ranges[index]
+            with open(partial_path, "r+b") as f:
+                f.seek(start)
+                try:
+                    await _stream_to_file(
+                        response.content, f, chunk_size, pbar, limit=end - start + 1
+                    )
+                finally:
+                    written[index] = f.tell() - start
+            if not response.content.at_eof():
+                # The first response may extend past its range; drop the rest
+                response.close()
+            if written[index] != end - start + 1:
+                raise ValueError(
+                    f"Incomplete range {start}-{end}: got {written[index]} bytes"
+                )
+
+        async def fetch_range(index: int) -> None:
+            start, end = ranges[index]
+            headers = {
+                **_DOWNLOAD_HEADERS,
+                "Range": f"bytes={start}-{end}",
+                "If-Range": if_range,
+            }
+            async with session.get(url, headers=headers, timeout=timeout) as response:
+                # A 200 means the file changed since the first response
+                if response.status != 206:
+                    raise ValueError(f"Range {start}-{end}: HTTP {response.status}")
+                content_range = response.headers.get("Content-Range", "")
+                if content_range != f"bytes {start}-{end}/{total}":
+                    raise ValueError(
+                        f"Range {start}-{end}: unexpected Content-Range {content_range!r}"
+                    )
+                await write_range(index, response)
+
+        tasks = [asyncio.ensure_future(write_range(0, first_response))]
+        tasks += [asyncio.ensure_future(fetch_range(i)) for i in range(1, len(ranges))]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Only the start of the first range is a contiguous prefix
+            with open(partial_path, "r+b") as f:
+                f.truncate(written[0])
+            raise
+        return sum(written)
+
     async def download_file(
         self,
         url: str,
         output_path: Optional[str] = None,
         video_id: Optional[int] = None,
         enable_resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        segments: int = DEFAULT_SEGMENTS,
     ) -> bool:
         """Download a file from URL with optional resume support.
 
+        The response body is streamed to disk one chunk at a time; each chunk
+        is written in a worker thread while the next one is read, so memory
+        use stays bounded by ``2 * chunk_size`` per connection.
+
+        Range support is detected from the download response itself. If the
+        server supports range requests, a fresh download of a large file is
+        split into up to ``segments`` byte ranges that are fetched in parallel,
+        each written to its offset in the partial file. If a segment fails or
+        the file changes in between, the download continues over a single
+        connection.
+
         Args:
             url: Download URL
             output_path: Optional output filename (relative to output_dir or absolute)
             video_id: Video ID for partial file validation (required for resume)
             enable_resume: Whether to attempt resuming partial downloads
+            chunk_size: Maximum number of bytes read from the response at once
+            segments: Maximum number of parallel range requests (1 disables)
 
         Returns:
             True if download completed successfully
@@ -338,17 +571,6 @@ class CDVLDownloader:
             logger.error("Session not initialized")
             return False
 
-        # Probe for range support and get content length
-        supports_ranges = False
-        expected_length: Optional[int] = None
-
-        if enable_resume and video_id is not None:
-            supports_ranges, expected_length = await self._probe_range_support(url)
-            if supports_ranges:
-                logger.info("Server supports range requests")
-            else:
-                logger.info("Server does not support range requests")
-
         try:
             # For resume support, we need to check partial files based on video_id
             # We'll determine the final filename from the GET response's Content-Disposition
@@ -359,17 +581,28 @@ class CDVLDownloader:
             partial_by_id: Optional[Path] = None
             meta_by_id: Optional[Path] = None
             resume_from = 0
+            expected_length: Optional[int] = None
+            if_range: Optional[str] = None
 
-            if enable_resume and video_id is not None and supports_ranges:
+            if enable_resume and video_id is not None:
                 # Look for partial file based on video_id pattern
                 partial_by_id = self.output_dir / f".cdvl_partial_{video_id}.tmp"
                 meta_by_id = self.output_dir / f".cdvl_partial_{video_id}.meta"
 
+                metadata = self._load_partial_metadata(meta_by_id)
+                if metadata is not None:
+                    expected_length = metadata.get("content_length")
+
                 is_valid, partial_size = self._validate_partial_file(
                     partial_by_id, meta_by_id, video_id, expected_length
                 )
-                if is_valid and partial_size > 0:
+                if is_valid and partial_size > 0 and metadata is not None:
                     resume_from = partial_size
+                    # Only resume the same version of the file: with If-Range,
+                    # the server sends the whole file instead if it changed
+                    if_range = _if_range_validator(
+                        metadata.get("etag"), metadata.get("last_modified")
+                    )
                     if expected_length:
                         percent = (partial_size / expected_length) * 100
                         logger.info(
@@ -382,11 +615,6 @@ class CDVLDownloader:
                             "attempting to resume..."
                         )
 
-            # Prepare request headers for range request
-            headers: dict[str, str] = {}
-            if resume_from > 0:
-                headers["Range"] = f"bytes={resume_from}-"
-
             # Use longer timeout for downloads - no total timeout, but with read timeout
             # to detect stalled connections (300s = 5 min inactivity before timeout)
             download_timeout = aiohttp.ClientTimeout(
@@ -394,120 +622,181 @@ class CDVLDownloader:
                 sock_read=300,  # 5 min read timeout to detect stalled connections
             )
 
-            async with self.session.get(
-                url, headers=headers, timeout=download_timeout
-            ) as response:
-                # Check response status
+            # Runs at most three times: a failed segmented download continues
+            # over a single connection from the prefix it kept, and if a partial
+            # file turns out to be unusable, it is discarded and the download is
+            # requested again from scratch
+            while True:
+                # Request a range when resuming, or the whole file as an open
+                # range when it may be split: a 206 response then both confirms
+                # range support and carries the total size, without a probe
+                headers = dict(_DOWNLOAD_HEADERS)
+                if resume_from > 0 or segments > 1:
+                    headers["Range"] = f"bytes={resume_from}-"
+                if if_range:
+                    headers["If-Range"] = if_range
+
+                response = await self.session.get(
+                    url, headers=headers, timeout=download_timeout
+                )
+
                 if resume_from > 0:
-                    if response.status == 206:
-                        logger.info("Resume accepted by server (206 Partial Content)")
-                    elif response.status == 200:
-                        # Server ignored range request, start from beginning
-                        logger.warning(
-                            "Server returned 200 instead of 206, "
-                            "restarting download from beginning"
-                        )
-                        resume_from = 0
-                    elif response.status == 416:
+                    restart_reason = None
+                    if response.status == 416:
                         # Range not satisfiable - partial file is invalid
+                        restart_reason = "Range not satisfiable (416)"
+                    elif response.status == 206 and expected_length is not None:
+                        remote_length = _content_range_total(
+                            response.headers.get("Content-Range", "")
+                        )
+                        if (
+                            remote_length is not None
+                            and remote_length != expected_length
+                        ):
+                            # The partial file belongs to a different version
+                            restart_reason = (
+                                "File size changed "
+                                f"({self._format_bytes(expected_length)}"
+                                f" -> {self._format_bytes(remote_length)})"
+                            )
+                    if restart_reason is not None:
                         logger.warning(
-                            "Range not satisfiable (416), "
-                            "restarting download from beginning"
+                            f"{restart_reason}, restarting download from beginning"
                         )
+                        response.close()
+                        for path in (partial_by_id, meta_by_id):
+                            if path is not None and path.exists():
+                                path.unlink()
                         resume_from = 0
-                        # Delete invalid partial file
-                        if partial_by_id and partial_by_id.exists():
-                            partial_by_id.unlink()
-                        if meta_by_id and meta_by_id.exists():
-                            meta_by_id.unlink()
-                        # Retry without range header
-                        return await self.download_file(
-                            url, output_path, video_id, enable_resume=False
-                        )
-                    else:
-                        logger.error(f"Download failed: HTTP {response.status}")
-                        return False
-                elif response.status != 200:
-                    logger.error(f"Download failed: HTTP {response.status}")
-                    return False
-
-                # Get filename from Content-Disposition header (from GET response)
-                content_disp = response.headers.get("Content-Disposition", "")
-                parsed_filename = parse_content_disposition(content_disp)
-
-                # Determine final filename
-                final_path: Path
-                if output_path:
-                    output_path_obj = Path(output_path)
-                    if output_path_obj.is_absolute():
-                        final_path = output_path_obj
-                    else:
-                        final_path = self.output_dir / output_path
-                elif parsed_filename:
-                    final_path = self.output_dir / parsed_filename
-                    logger.info(f"Filename from server: {parsed_filename}")
-                else:
-                    # Fallback: use video_id if available
-                    if video_id is not None:
-                        final_path = self.output_dir / f"cdvl_video_{video_id}.bin"
-                    else:
-                        # Last resort: Extract from URL
-                        url_parts = url.rstrip("/").split("/")
-                        if len(url_parts) >= 3:
-                            url_video_id = url_parts[-3]
-                            final_path = (
-                                self.output_dir / f"cdvl_video_{url_video_id}.bin"
+                        expected_length = None
+                        if_range = None
+                        continue
+
+                async with response:
+                    # Check response status
+                    if resume_from > 0:
+                        if response.status == 206:
+                            logger.info(
+                                "Resume accepted by server (206 Partial Content)"
+                            )
+                        elif response.status == 200:
+                            # Server ignored the range or the file changed (If-Range),
+                            # so this is the whole file: start from the beginning
+                            logger.warning(
+                                "Server returned 200 instead of 206, "
+                                "restarting download from beginning"
                             )
+                            resume_from = 0
                         else:
-                            final_path = self.output_dir / "cdvl_video_unknown.bin"
-
-                logger.info(f"Target file: {final_path}")
-
-                # Get content length for this response
-                response_length_str = response.headers.get("Content-Length")
-                response_length: Optional[int] = None
-                if response_length_str:
-                    response_length = int(response_length_str)
-
-                # Calculate total size
-                total_size = expected_length
-                if total_size is None and response_length is not None:
-                    total_size = resume_from + response_length
-
-                if total_size:
-                    logger.info(f"Total size: {self._format_bytes(total_size)}")
-
-                # Determine which partial file to use
-                # If resuming, use the video_id-based partial file
-                # Otherwise, create a new one based on video_id or fallback
-                if resume_from > 0 and partial_by_id:
-                    partial_path = partial_by_id
-                    meta_path = meta_by_id
-                elif video_id is not None:
-                    partial_path = self.output_dir / f".cdvl_partial_{video_id}.tmp"
-                    meta_path = self.output_dir / f".cdvl_partial_{video_id}.meta"
-                else:
-                    partial_path = final_path.with_suffix(
-                        final_path.suffix + ".partial"
-                    )
-                    meta_path = final_path.with_suffix(
-                        final_path.suffix + ".partial.meta"
-                    )
+                            logger.error(f"Download failed: HTTP {response.status}")
+                            return False
+                    elif response.status not in (200, 206):
+                        logger.error(f"Download failed: HTTP {response.status}")
+                        return False
 
-                # Save metadata for potential future resume
-                if video_id is not None and meta_path:
-                    self._save_partial_metadata(
-                        meta_path, video_id, total_size, final_path.name
+                    supports_ranges = response.status == 206
+                    logger.debug(f"Range support: {supports_ranges}")
+
+                    # Get content length for this response
+                    response_length_str = response.headers.get("Content-Length")
+                    response_length: Optional[int] = None
+                    if response_length_str:
+                        response_length = int(response_length_str)
+
+                    # Calculate total size ("Content-Range: bytes start-end/total"
+                    # for partial responses)
+                    total_size: Optional[int] = None
+                    if supports_ranges:
+                        total_size = _content_range_total(
+                            response.headers.get("Content-Range", "")
+                        )
+                    if total_size is None and response_length is not None:
+                        total_size = resume_from + response_length
+
+                    # Split fresh downloads of large files into parallel ranges;
+                    # this response then provides the first one. The other ranges
+                    # are requested with If-Range, so without a validator to tie
+                    # them to this version of the file, it is not split
+                    ranges: list[tuple[int, int]] = []
+                    segment_if_range = _if_range_validator(
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
                     )
+                    if (
+                        supports_ranges
+                        and not resume_from
+                        and segments > 1
+                        and total_size
+                        and segment_if_range
+                    ):
+                        ranges = _split_ranges(total_size, segments)
+                        if len(ranges) == 1:
+                            ranges = []
+
+                    # Get filename from Content-Disposition header (from GET response)
+                    content_disp = response.headers.get("Content-Disposition", "")
+                    parsed_filename = parse_content_disposition(content_disp)
+
+                    # Determine final filename
+                    final_path: Path
+                    if output_path:
+                        output_path_obj = Path(output_path)
+                        if output_path_obj.is_absolute():
+                            final_path = output_path_obj
+                        else:
+                            final_path = self.output_dir / output_path
+                    elif parsed_filename:
+                        final_path = self.output_dir / parsed_filename
+                        logger.info(f"Filename from server: {parsed_filename}")
+                    else:
+                        # Fallback: use video_id if available
+                        if video_id is not None:
+                            final_path = self.output_dir / f"cdvl_video_{video_id}.bin"
+                        else:
+                            # Last resort: Extract from URL
+                            url_parts = url.rstrip("/").split("/")
+                            if len(url_parts) >= 3:
+                                url_video_id = url_parts[-3]
+                                final_path = (
+                                    self.output_dir / f"cdvl_video_{url_video_id}.bin"
+                                )
+                            else:
+                                final_path = self.output_dir / "cdvl_video_unknown.bin"
+
+                    logger.info(f"Target file: {final_path}")
+
+                    if total_size:
+                        logger.info(f"Total size: {self._format_bytes(total_size)}")
+
+                    # Determine which partial file to use
+                    # If resuming, use the video_id-based partial file
+                    # Otherwise, create a new one based on video_id or fallback
+                    if resume_from > 0 and partial_by_id:
+                        partial_path = partial_by_id
+                        meta_path = meta_by_id
+                    elif video_id is not None:
+                        partial_path = self.output_dir / f".cdvl_partial_{video_id}.tmp"
+                        meta_path = self.output_dir / f".cdvl_partial_{video_id}.meta"
+                    else:
+                        partial_path = final_path.with_suffix(
+                            final_path.suffix + ".partial"
+                        )
+                        meta_path = final_path.with_suffix(
+                            final_path.suffix + ".partial.meta"
+                        )
 
-                # Download with progress bar
-                chunk_size = 1024 * 1024  # 1 MB chunks
-                bytes_written = resume_from
-
-                # Open in append mode if resuming, write mode otherwise
-                file_mode = "ab" if resume_from > 0 else "wb"
+                    # Save metadata for potential future resume
+                    if video_id is not None and meta_path:
+                        self._save_partial_metadata(
+                            meta_path,
+                            video_id,
+                            total_size,
+                            final_path.name,
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                        )
 
-                with open(partial_path, file_mode) as f:
+                    # Download with progress bar
                     with tqdm(
                         total=total_size,
                         initial=resume_from,
@@ -517,14 +806,57 @@ class CDVLDownloader:
                         desc=final_path.name,
                         disable=not total_size,
                     ) as pbar:
-                        async for chunk in response.content.iter_chunked(chunk_size):
-                            f.write(chunk)
-                            bytes_written += len(chunk)
-                            if total_size:
-                                pbar.update(len(chunk))
-
-            # Verify file size
-            final_size = partial_path.stat().st_size
+                        if ranges and segment_if_range:
+                            logger.info(
+                                f"Downloading in {len(ranges)} parallel segments"
+                            )
+                            try:
+                                final_size = await self._download_ranges(
+                                    response,
+                                    url,
+                                    partial_path,
+                                    ranges,
+                                    segment_if_range,
+                                    pbar,
+                                    chunk_size,
+                                    download_timeout,
+                                )
+                            except Exception as e:
+                                logger.warning(
+                                    "Segmented download failed "
+                                    f"({type(e).__name__}: {e}), "
+                                    "continuing with a single connection"
+                                )
+                                # Resume from the prefix of the first range that was
+                                # kept, with If-Range in case the file changed
+                                resume_from = partial_path.stat().st_size
+                                if_range = segment_if_range if resume_from else None
+                                expected_length = total_size
+                                segments = 1
+                                continue
+                        else:
+                            # Open in append mode if resuming, write mode otherwise
+                            file_mode = "ab" if resume_from > 0 else "wb"
+                            with open(partial_path, file_mode) as f:
+                                preallocated = False
+                                if total_size and not resume_from:
+                                    _preallocate(f, total_size)
+                                    preallocated = True
+                                try:
+                                    await _stream_to_file(
+                                        response.content, f, chunk_size, pbar
+                                    )
+                                finally:
+                                    # Appends leave the position at the end of
+                                    # the data received
+                                    final_size = f.tell()
+                                    if preallocated:
+                                        # Keep only what was received, so the size
+                                        # check and a later resume see the real length
+                                        f.truncate(final_size)
+                break
+
+            # Verify file size (counted while writing, no need to stat the file)
             if total_size is not None:
                 if final_size == total_size:
                     logger.info(
@@ -536,10 +868,8 @@ class CDVLDownloader:
                         f"got {self._format_bytes(final_size)}"
                     )
 
-            # Rename partial file to final name
-            if final_path.exists():
-                final_path.unlink()
-            partial_path.rename(final_path)
+            # Rename partial file to final name, replacing any existing file
+            partial_path.replace(final_path)
 
             # Clean up metadata file
             if meta_path and meta_path.exists():
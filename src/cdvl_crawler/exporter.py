@@ -7,11 +7,20 @@ from __future__ import annotations
 import csv
 import json
 import logging
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import IO, Any, Callable, Iterable, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # optional, installed with the "speed" extra
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Parses one JSONL line (as bytes; both parsers accept UTF-8 directly)
+_loads_json: Callable[[bytes], Any] = orjson.loads if orjson else json.loads
+
 
 class CDVLExporter:
     """Export JSONL data to CSV format"""
@@ -51,9 +60,11 @@ class CDVLExporter:
             return value
         elif isinstance(value, list):
             # For lists, join with semicolons or serialize as JSON
-            if all(isinstance(item, str) for item in value):
-                return "; ".join(str(item) for item in value)
-            else:
+            # (str.join checks the item types itself, failing on the first
+            # non-string)
+            try:
+                return "; ".join(value)
+            except TypeError:
                 return json.dumps(value, ensure_ascii=False)
         elif isinstance(value, dict):
             return json.dumps(value, ensure_ascii=False)
@@ -70,9 +81,6 @@ class CDVLExporter:
         Returns:
             List of column names
         """
-        # Use a dict to preserve insertion order while ensuring uniqueness
-        columns_seen: dict[str, None] = {}
-
         # Preferred order for common columns
         preferred_order = [
             "id",
@@ -88,26 +96,45 @@ class CDVLExporter:
             "extracted_at",
         ]
 
-        for col in preferred_order:
-            columns_seen[col] = None
-
-        # Add any remaining columns from records
+        # Collect the columns that actually exist in records in one pass, using
+        # a dict to preserve first-seen order while ensuring uniqueness
+        present: dict[str, None] = {}
         for record in records:
-            for key in record.keys():
-                if key not in columns_seen:
-                    columns_seen[key] = None
+            for key in record:
+                present[key] = None
 
-        # Filter to only columns that actually exist in records
-        all_keys: set[str] = set()
-        for record in records:
-            all_keys.update(record.keys())
+        # Preferred columns first, then any remaining ones in first-seen order
+        columns = [col for col in preferred_order if col in present]
+        preferred = set(columns)
+        return columns + [col for col in present if col not in preferred]
+
+    def _read_records(self, f: IO[bytes]) -> Iterator[dict]:
+        """
+        Parse records from an open JSONL file, skipping blank and invalid lines.
+
+        Args:
+            f: Input file opened in binary mode
 
-        return [col for col in columns_seen if col in all_keys]
+        Yields:
+            Record dictionaries
+        """
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield _loads_json(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping invalid JSON on line {line_num}: {e}")
 
     def export(self) -> bool:
         """
         Export JSONL to CSV.
 
+        With explicit columns, records are written as they are read, without
+        keeping them in memory; otherwise all records are loaded first to
+        determine the columns.
+
         Returns:
             True if export was successful, False otherwise
         """
@@ -116,52 +143,45 @@ class CDVLExporter:
             logger.error(f"Input file not found: {self.input_file}")
             return False
 
-        # Load all records
-        records: list[dict] = []
-        try:
-            with open(self.input_file, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        record = json.loads(line)
-                        records.append(record)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Skipping invalid JSON on line {line_num}: {e}")
-        except OSError as e:
-            logger.error(f"Failed to read input file: {e}")
-            return False
-
-        if not records:
-            logger.error("No valid records found in input file")
-            return False
-
-        # Determine columns
-        if self.columns:
-            columns = self.columns
-        else:
-            columns = self._get_all_columns(records)
-
-        # Create output directory if needed
-        self.output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write CSV
         try:
-            with open(self.output_file, "w", encoding="utf-8", newline="") as f:
-                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
-
-                # Write header
-                writer.writerow(columns)
-
-                # Write data rows
-                for record in records:
-                    row = [self._flatten_value(record.get(col)) for col in columns]
-                    writer.writerow(row)
-
-            logger.info(f"Exported {len(records)} records to {self.output_file}")
-            return True
+            with open(self.input_file, "rb") as infile:
+                # Determine columns
+                records: Iterable[dict]
+                if self.columns:
+                    columns = self.columns
+                    # Read ahead to the first record so that nothing is
+                    # written if there are none
+                    stream = self._read_records(infile)
+                    first = next(stream, None)
+                    records = chain((first,), stream) if first is not None else ()
+                else:
+                    records = list(self._read_records(infile))
+                    columns = self._get_all_columns(records)
+
+                if not records:
+                    logger.error("No valid records found in input file")
+                    return False
+
+                # Create output directory if needed
+                self.output_file.parent.mkdir(parents=True, exist_ok=True)
+
+                # Write CSV
+                count = 0
+                with open(self.output_file, "w", encoding="utf-8", newline="") as f:
+                    writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+
+                    # Write header
+                    writer.writerow(columns)
+
+                    # Write data rows
+                    for record in records:
+                        row = [self._flatten_value(record.get(col)) for col in columns]
+                        writer.writerow(row)
+                        count += 1
 
         except OSError as e:
-            logger.error(f"Failed to write output file: {e}")
+            logger.error(f"Export failed: {e}")
             return False
+
+        logger.info(f"Exported {count} records to {self.output_file}")
+        return True
@@ -6,13 +6,33 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # optional, installed with the "speed" extra
+    orjson = None
 
 from cdvl_crawler.types import VideoData
 
 logger = logging.getLogger(__name__)
 
 
+if orjson is not None:
+    _loads_json: Callable[[bytes], Any] = orjson.loads
+
+    def _dumps_json(data: Any) -> str:
+        """Serialize data as compact JSON"""
+        return orjson.dumps(data).decode("utf-8")
+
+else:
+    _loads_json = json.loads
+
+    def _dumps_json(data: Any) -> str:
+        """Serialize data as compact JSON"""
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
 class CDVLSiteGenerator:
     """Generate a static HTML site from videos.jsonl"""
 
@@ -36,13 +56,13 @@ class CDVLSiteGenerator:
             logger.error(f"Input file not found: {self.input_file}")
             return videos
 
-        with open(self.input_file, "r", encoding="utf-8") as f:
+        with open(self.input_file, "rb") as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    video = json.loads(line)
+                    video = _loads_json(line)
                     videos.append(video)
                 except json.JSONDecodeError as e:
                     logger.warning(f"Failed to parse line {line_num}: {e}")
@@ -54,11 +74,23 @@ class CDVLSiteGenerator:
         """Truncate text to max_length and add ellipsis if needed"""
         if len(text) <= max_length:
             return text
-        return text[:max_length].rsplit(" ", 1)[0] + "..."
+        # Cut at the last space within max_length, if there is one
+        cut = text.rfind(" ", 0, max_length)
+        return text[: cut if cut != -1 else max_length] + "..."
 
     def escape_json(self, data: list[Any]) -> str:
         """Escape JSON for embedding in HTML"""
-        return json.dumps(data).replace("<", "\\u003c").replace(">", "\\u003e")
+        # Escaping < and > keeps "</script>" and "<!--" out of the script
+        # block; U+2028/U+2029 are line terminators to pre-ES2019 engines.
+        # Chained str.replace calls are much faster than one str.translate with
+        # a dict table, which looks up and copies every character one by one
+        return (
+            _dumps_json(data)
+            .replace("<", "\\u003c")
+            .replace(">", "\\u003e")
+            .replace("\u2028", "\\u2028")
+            .replace("\u2029", "\\u2029")
+        )
 
     def generate_html(self, videos: list[VideoData]) -> str:
         """Generate the complete HTML page with brutalist design"""
@@ -16,6 +16,9 @@ from yarl import URL
 
 logger = logging.getLogger(__name__)
 
+# One comma-separated video ID; a comma must be followed by another ID
+_VIDEO_ID_RE = re.compile(r"\s*(\d+)\s*(?:,(?!\s*\Z)|\Z)")
+
 # CDVL Database Content User License Agreement
 CDVL_LICENSE = """
 The owner of the CDVL would like you to read and accept the following terms.
@@ -138,6 +141,8 @@ def get_default_config() -> Dict[str, Any]:
         "max_concurrent_requests": 5,
         "max_consecutive_failures": 1000,  # Stop after 1000 consecutive empty/failed responses
         "request_delay": 0.1,
+        "probe_step": 100,  # After this many misses in a row, probe further ahead
+        "max_probe_attempts": 20,  # Number of IDs probed (20*100=2000 ID range)
         "max_video_id": None,  # Optional: Stop crawling videos at this ID
         "max_dataset_id": None,  # Optional: Stop crawling datasets at this ID
     }
@@ -232,12 +237,44 @@ def get_headers(config: Dict[str, Any]) -> Dict[str, str]:
     return config.get("headers", {})
 
 
+def create_connector(limit: int = 5) -> aiohttp.TCPConnector:
+    """
+    Create a keep-alive TCP connector
+
+    Connections to cdvl.org are pooled and kept open between requests, so the
+    TCP and TLS handshakes are paid once per connection instead of per request.
+    Host lookups are cached for 10 minutes, which outlasts most single video
+    downloads; concurrent lookups of the same host share one resolution.
+
+    Args:
+        limit: Maximum number of pooled connections
+
+    Returns:
+        TCPConnector for use with a ClientSession
+    """
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit,
+        keepalive_timeout=75,
+        use_dns_cache=True,
+        ttl_dns_cache=600,
+    )
+
+
 async def create_session(
-    config: Dict[str, Any], timeout_seconds: int = 30
+    config: Dict[str, Any],
+    timeout_seconds: int = 30,
+    connector: Optional[aiohttp.TCPConnector] = None,
 ) -> aiohttp.ClientSession:
-    """Create an aiohttp session with configured headers and timeout"""
+    """Create an aiohttp session with configured headers, timeout and connector"""
     timeout = aiohttp.ClientTimeout(total=timeout_seconds)
-    return aiohttp.ClientSession(headers=get_headers(config), timeout=timeout)
+    # Accept-Encoding is left to aiohttp: it requests gzip/deflate, plus br and
+    # zstd when their decoders are installed, and decompresses transparently
+    if connector is None:
+        connector = create_connector(config.get("max_concurrent_requests", 5))
+    return aiohttp.ClientSession(
+        headers=get_headers(config), timeout=timeout, connector=connector
+    )
 
 
 async def login_to_cdvl(
@@ -366,3 +403,35 @@ def parse_content_disposition(content_disp: Optional[str]) -> Optional[str]:
             return unquote(filename.strip("\"'"))
 
     return None
+
+
+def parse_video_ids(value: str) -> list[int]:
+    """
+    Parse a comma-separated list of video IDs in a single pass
+
+    Args:
+        value: Comma-separated IDs, e.g. "1, 5,10"
+
+    Returns:
+        List of video IDs in the given order
+
+    Raises:
+        ValueError: If the format is invalid or an ID is not positive
+    """
+    video_ids: list[int] = []
+    pos = 0
+    for match in _VIDEO_ID_RE.finditer(value):
+        if match.start() != pos:
+            break
+        video_id = int(match.group(1))
+        if video_id <= 0:
+            raise ValueError("Video IDs must be positive integers")
+        video_ids.append(video_id)
+        pos = match.end()
+
+    if not video_ids or pos != len(value):
+        raise ValueError(
+            "Invalid video ID format. Use comma-separated integers (e.g., 1,5,10)"
+        )
+
+    return video_ids
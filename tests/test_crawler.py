@@ -0,0 +1,222 @@
+"""
+Tests for cdvl_crawler.crawler module
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from cdvl_crawler import crawler as crawler_module
+from cdvl_crawler.crawler import CDVLCrawler, _decode_body
+
+SAMPLE_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>CDVL</title><script>var x = 1;</script></head>
+<body>
+<div class="main-container container-fluid">
+  <div class="row">
+    <div class="col">
+      <h2>   </h2>
+      <h3>Test <em>Video</em></h3>
+      <p>First paragraph with <a href="/related">a link</a> inside.</p>
+      <p>   </p>
+      <p><strong>Size of upload video:</strong> 1.5 GB</p>
+      <p>Entities &amp; <!-- hidden --> text<script>ignored()</script></p>
+      <a>no href</a>
+      <table><tr><td>1</td></tr></table>
+      <img src="/img.png"><img>
+      <video src="/v.mp4"><source src="/v.webm"></video>
+      <button class="btn btn-primary"> Download  clip_01.avi </button>
+    </div>
+  </div>
+</div>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def crawler(temp_dir):
+    return CDVLCrawler(output_dir=str(temp_dir))
+
+
+class TestParseContent:
+    """Tests for CDVLCrawler._parse_content()"""
+
+    def test_extracts_fields(self, crawler):
+        data = crawler._parse_content(SAMPLE_PAGE, "video")
+        assert data is not None
+
+        assert data["content_type"] == "video"
+        # Text fragments are stripped and joined without separators
+        assert data["title"] == "TestVideo"
+        assert data["paragraphs"] == [
+            "First paragraph witha linkinside.",
+            "Size of upload video:1.5 GB",
+            "Entities &text",
+        ]
+        assert data["links"] == [{"text": "a link", "href": "/related"}]
+        assert data["tables_count"] == 1
+        assert data["media"] == [
+            {"type": "img", "src": "/img.png"},
+            {"type": "video", "src": "/v.mp4"},
+            {"type": "source", "src": "/v.webm"},
+        ]
+        assert data["file_size"] == "1.5 GB"
+        assert data["filename"] == "clip_01.avi"
+
+    def test_parses_utf8_bytes(self, crawler):
+        page = SAMPLE_PAGE.replace("First paragraph", "Première ligne")
+        from_bytes = crawler._parse_content(page.encode("utf-8"), "video")
+        from_str = crawler._parse_content(page, "video")
+        assert from_bytes is not None and from_str is not None
+        assert from_bytes["paragraphs"][0].startswith("Première")
+        assert from_bytes["paragraphs"] == from_str["paragraphs"]
+
+    def test_decode_body(self):
+        body = "Größe".encode("utf-8")
+        assert _decode_body(body, None) is body
+        assert _decode_body(body, "UTF-8") is body
+        assert _decode_body("Größe".encode("latin-1"), "iso-8859-1") == "Größe"
+
+    def test_returns_none_without_content(self, crawler):
+        error_page = SAMPLE_PAGE.replace(
+            "First paragraph", "Something went wrong, first paragraph"
+        )
+        assert crawler._parse_content(error_page, "video") is None
+        assert crawler._parse_content("", "video") is None
+        assert crawler._parse_content("<html></html>", "dataset") is None
+
+
+class TestJsonl:
+    """Tests for the crawler's JSONL reading and writing"""
+
+    def test_last_id_from_existing_file(self, crawler, sample_videos_jsonl):
+        assert crawler._get_last_id_from_jsonl(str(sample_videos_jsonl)) == 43
+
+    def test_last_id_missing_file(self, crawler, temp_dir):
+        assert crawler._get_last_id_from_jsonl(str(temp_dir / "none.jsonl")) == 0
+
+    def test_write_then_resume(self, crawler, temp_dir, sample_video_data):
+        path = temp_dir / "out.jsonl"
+        records = [dict(sample_video_data, id=i, title="Vidéo") for i in (7, 8)]
+        with open(path, "ab") as fh:
+            crawler._write_jsonl(fh, records)
+            crawler._write_jsonl(fh, [])
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == records
+        assert "Vidéo" in lines[0]
+        assert crawler._get_last_id_from_jsonl(str(path)) == 8
+
+    def test_last_id_ignores_truncated_tail(self, crawler, sample_videos_jsonl):
+        with open(sample_videos_jsonl, "a") as f:
+            f.write('{"id": 44, "title": "cut o')
+        assert crawler._get_last_id_from_jsonl(str(sample_videos_jsonl)) == 43
+
+    def test_last_id_grows_tail_window(self, crawler, temp_dir, monkeypatch):
+        monkeypatch.setattr(crawler_module, "_TAIL_BLOCK_BYTES", 16)
+        path = temp_dir / "grow.jsonl"
+        path.write_text('{"id": 5}\n{"id": 6}\n' + "x" * 40 + "\n")
+        assert crawler._get_last_id_from_jsonl(str(path)) == 6
+
+    def test_last_id_falls_back_to_full_scan(self, crawler, temp_dir, monkeypatch):
+        monkeypatch.setattr(crawler_module, "_TAIL_BLOCK_BYTES", 16)
+        monkeypatch.setattr(crawler_module, "_TAIL_MAX_BYTES", 32)
+        path = temp_dir / "scan.jsonl"
+        path.write_text('{"id": 9}\n{"id": 3}\n' + "x" * 100 + "\n")
+        assert crawler._get_last_id_from_jsonl(str(path)) == 9
+
+
+class TestCrawlContent:
+    """Tests for CDVLCrawler._crawl_content()"""
+
+    @staticmethod
+    def _run(crawler, content_type, found_ids, start_id=1, **config):
+        async def fake_fetch(content_id):
+            # Make fetches finish out of ID order
+            await asyncio.sleep(0.001 * (content_id % 3))
+            if content_id in found_ids:
+                return {"id": content_id, "title": f"Item {content_id}"}
+            return None
+
+        crawler.config.update(
+            {
+                "max_concurrent_requests": 3,
+                "max_consecutive_failures": 4,
+                "request_delay": 0,
+                **config,
+            }
+        )
+        setattr(crawler, f"_fetch_{content_type}", fake_fetch)
+        asyncio.run(
+            crawler._crawl_content(content_type, start_id, asyncio.Semaphore(3))
+        )
+
+    def test_writes_found_ids_in_order(self, crawler, temp_dir):
+        self._run(crawler, "video", {1, 2, 5, 8})
+
+        lines = (temp_dir / "videos.jsonl").read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 5, 8]
+        assert crawler.stats["videos"]["success"] == 4
+        # Stops once max_consecutive_failures IDs in a row are empty
+        assert crawler.stats["videos"]["empty"] >= 4
+        assert crawler._get_last_id_from_jsonl(str(temp_dir / "videos.jsonl")) == 8
+        assert crawler.video_pbar is not None
+        assert crawler.video_pbar.n == sum(crawler.stats["videos"].values())
+
+    def test_respects_max_id(self, crawler, temp_dir):
+        crawler.config["max_dataset_id"] = 4
+        self._run(crawler, "dataset", set(range(1, 100)), start_id=2)
+
+        lines = (temp_dir / "datasets.jsonl").read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [2, 3, 4]
+        assert crawler.stats["datasets"] == {"success": 3, "failed": 0, "empty": 0}
+
+    def test_probe_continues_through_gap(self, crawler, temp_dir):
+        found = {1, 2, *range(40, 45)}
+        self._run(
+            crawler,
+            "video",
+            found,
+            max_consecutive_failures=30,
+            probe_step=5,
+            max_probe_attempts=10,
+        )
+
+        lines = (temp_dir / "videos.jsonl").read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == sorted(found)
+        # The 37-ID gap exceeds max_consecutive_failures but a probe hit at
+        # ID 42 keeps the scan going; after 44 the probes find nothing (plus
+        # at most one window of fetches already in flight)
+        assert 37 + 5 <= crawler.stats["videos"]["empty"] <= 37 + 5 + 3
+
+    def test_probe_stops_early(self, crawler, temp_dir):
+        self._run(
+            crawler,
+            "dataset",
+            {1, 2},
+            max_consecutive_failures=1000,
+            probe_step=5,
+            max_probe_attempts=3,
+        )
+
+        lines = (temp_dir / "datasets.jsonl").read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [1, 2]
+        # Probing starts after probe_step misses, not max_consecutive_failures
+        assert 5 <= crawler.stats["datasets"]["empty"] <= 5 + 3
+
+    def test_probe_step_zero_scans_until_max_failures(self, crawler, temp_dir):
+        self._run(
+            crawler,
+            "video",
+            {1, 2, 30},
+            max_consecutive_failures=30,
+            probe_step=0,
+        )
+
+        lines = (temp_dir / "videos.jsonl").read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 30]
+        # Without probing, only max_consecutive_failures ends the scan
+        assert 27 + 30 <= crawler.stats["videos"]["empty"] < 27 + 30 + 10
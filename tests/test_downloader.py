@@ -0,0 +1,316 @@
+"""
+Tests for cdvl_crawler.downloader module
+"""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from cdvl_crawler import downloader as downloader_module
+from cdvl_crawler.downloader import CDVLDownloader, _split_ranges
+
+PAYLOAD = os.urandom(100_000)
+
+
+def make_app(
+    payload: bytes,
+    new_payload: Optional[bytes] = None,
+    stall_after: Optional[int] = None,
+    partial: Optional[Path] = None,
+):
+    """App serving ``payload`` at /file with support for single byte ranges
+
+    The payload's ETag is "v1". If ``new_payload`` is given, it replaces the
+    payload (with ETag "v2") after the first request. If ``stall_after`` is
+    given, the first request's response stalls after that many bytes, and
+    bounded ranges fail with HTTP 500 once those bytes are in the ``partial``
+    file. Returns the app and the list of Range headers it receives.
+    """
+    requests: list = []
+
+    def received() -> bool:
+        assert stall_after is not None and partial is not None
+        return (
+            partial.exists()
+            and partial.read_bytes()[:stall_after] == payload[:stall_after]
+        )
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        range_header = request.headers.get("Range")
+        requests.append(range_header)
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": 'attachment; filename="video.avi"',
+            "ETag": '"v1"',
+        }
+        nonlocal payload
+        if new_payload is not None and len(requests) > 1:
+            payload = new_payload
+            headers["ETag"] = '"v2"'
+        if_range = request.headers.get("If-Range")
+        if not range_header or (if_range and if_range != headers["ETag"]):
+            return web.Response(body=payload, headers=headers)
+
+        start_str, end_str = range_header.removeprefix("bytes=").split("-")
+        start = int(start_str)
+        end = int(end_str) if end_str else len(payload) - 1
+        headers["Content-Range"] = f"bytes {start}-{end}/{len(payload)}"
+        if stall_after is not None and len(requests) == 1:
+            response = web.StreamResponse(status=206, headers=headers)
+            response.content_length = end - start + 1
+            await response.prepare(request)
+            await response.write(payload[start:stall_after])
+            # Until the client gives up on this response
+            while request.transport is not None and not request.transport.is_closing():
+                await asyncio.sleep(0.01)
+            return response
+        if stall_after is not None and end_str:
+            while not received():
+                await asyncio.sleep(0.01)
+            return web.Response(status=500)
+        return web.Response(status=206, body=payload[start : end + 1], headers=headers)
+
+    app = web.Application()
+    app.router.add_get("/file", handler)
+    return app, requests
+
+
+async def download(app: web.Application, output_dir, **kwargs) -> bool:
+    async with TestServer(app) as server:
+        async with CDVLDownloader(output_dir=str(output_dir)) as downloader:
+            kwargs.setdefault("video_id", 7)
+            return await downloader.download_file(
+                str(server.make_url("/file")), **kwargs
+            )
+
+
+@pytest.fixture
+def small_segments(monkeypatch):
+    monkeypatch.setattr(downloader_module, "MIN_SEGMENT_SIZE", 10_000)
+
+
+class TestSplitRanges:
+    """Tests for _split_ranges()"""
+
+    def test_contiguous_ranges(self, small_segments):
+        ranges = _split_ranges(100_001, 4)
+        assert len(ranges) == 4
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == 100_000
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert start == end + 1
+
+    def test_small_files_are_not_split(self, small_segments):
+        assert _split_ranges(25_000, 8) == [(0, 12_499), (12_500, 24_999)]
+        assert _split_ranges(5_000, 4) == [(0, 4_999)]
+
+
+class TestDownloadFile:
+    """Tests for CDVLDownloader.download_file()"""
+
+    def test_segmented_download(self, temp_dir, small_segments):
+        app, requests = make_app(PAYLOAD)
+        assert asyncio.run(download(app, temp_dir, segments=4))
+
+        assert (temp_dir / "video.avi").read_bytes() == PAYLOAD
+        assert not list(temp_dir.glob(".cdvl_partial_*"))
+        # The first request doubles as the first segment
+        assert requests[0] == "bytes=0-"
+        assert len(requests) == 4
+
+    def test_single_stream_download(self, temp_dir, small_segments):
+        app, requests = make_app(PAYLOAD)
+        assert asyncio.run(download(app, temp_dir, segments=1))
+
+        assert (temp_dir / "video.avi").read_bytes() == PAYLOAD
+        assert requests == [None]
+
+    @pytest.mark.parametrize(
+        "options, partial_name",
+        [
+            ({}, ".cdvl_partial_7.tmp"),
+            ({"video_id": None}, "video.avi.partial"),
+            ({"enable_resume": False}, ".cdvl_partial_7.tmp"),
+        ],
+    )
+    def test_failed_segment_falls_back_to_single_stream(
+        self, temp_dir, small_segments, options, partial_name
+    ):
+        app, requests = make_app(
+            PAYLOAD, stall_after=10_000, partial=temp_dir / partial_name
+        )
+        assert asyncio.run(download(app, temp_dir, **options))
+
+        assert (temp_dir / "video.avi").read_bytes() == PAYLOAD
+        assert not list(temp_dir.glob(".cdvl_partial_*"))
+        assert not (temp_dir / partial_name).exists()
+        # The single stream resumes from the kept prefix of the first range
+        assert requests[0] == "bytes=0-"
+        assert requests[-1] == "bytes=10000-"
+        assert len(requests) == 5
+
+    def test_changed_file_between_segments(self, temp_dir, small_segments):
+        new_payload = os.urandom(len(PAYLOAD))
+        app, requests = make_app(PAYLOAD, new_payload=new_payload)
+        assert asyncio.run(download(app, temp_dir))
+
+        # No mix of both versions: the segments' If-Range got whole files
+        # back, and the single stream fetched the new version
+        assert (temp_dir / "video.avi").read_bytes() == new_payload
+        assert not list(temp_dir.glob(".cdvl_partial_*"))
+        assert requests[0] == "bytes=0-"
+
+    def test_interrupted_stream_keeps_received_bytes(self, temp_dir):
+        async def handler(request: web.Request) -> web.StreamResponse:
+            response = web.StreamResponse(headers={"Content-Length": "100000"})
+            await response.prepare(request)
+            await response.write(PAYLOAD[:30_000])
+            request.transport.close()
+            return response
+
+        app = web.Application()
+        app.router.add_get("/file", handler)
+        assert not asyncio.run(download(app, temp_dir, segments=1))
+
+        # The preallocated file is cut back to what was actually received
+        partial = (temp_dir / ".cdvl_partial_7.tmp").read_bytes()
+        assert partial == PAYLOAD[: len(partial)]
+        assert len(partial) <= 30_000
+
+    def write_partial(self, temp_dir, data: bytes, etag: str) -> None:
+        (temp_dir / ".cdvl_partial_7.tmp").write_bytes(data)
+        (temp_dir / ".cdvl_partial_7.meta").write_text(
+            json.dumps({"video_id": 7, "content_length": len(PAYLOAD), "etag": etag})
+        )
+
+    def test_resume_same_version(self, temp_dir):
+        self.write_partial(temp_dir, PAYLOAD[:5_000], '"v1"')
+        app, requests = make_app(PAYLOAD)
+        assert asyncio.run(download(app, temp_dir, segments=1))
+
+        assert (temp_dir / "video.avi").read_bytes() == PAYLOAD
+        assert requests == ["bytes=5000-"]
+
+    def test_changed_version_downloads_whole_file(self, temp_dir):
+        self.write_partial(temp_dir, b"stale", '"v0"')
+        app, requests = make_app(PAYLOAD)
+        assert asyncio.run(download(app, temp_dir, segments=1))
+
+        # If-Range made the server send the whole file in the same response
+        assert (temp_dir / "video.avi").read_bytes() == PAYLOAD
+        assert requests == ["bytes=5-"]
+
+    def test_changed_file_restarts_download(self, temp_dir):
+        (temp_dir / ".cdvl_partial_7.tmp").write_bytes(b"stale")
+        (temp_dir / ".cdvl_partial_7.meta").write_text(
+            '{"video_id": 7, "content_length": 123456, "filename": "video.avi"}'
+        )
+        app, requests = make_app(PAYLOAD)
+        assert asyncio.run(download(app, temp_dir, segments=1))
+
+        assert (temp_dir / "video.avi").read_bytes() == PAYLOAD
+        assert requests == ["bytes=5-", None]
+
+
+class TestWarmConnections:
+    """Tests for CDVLDownloader._warm_connections()"""
+
+    def test_does_not_touch_session_cookies(self, temp_dir):
+        heads: list = []
+
+        async def head(request: web.Request) -> web.Response:
+            heads.append(request.path)
+            response = web.Response()
+            response.set_cookie("ASP.NET_SessionId", "from-warm-up")
+            return response
+
+        app = web.Application()
+        app.router.add_route("HEAD", "/", head)
+
+        async def run():
+            # A host name, as the cookie jar ignores cookies from IP addresses
+            async with TestServer(app, host="localhost") as server:
+                async with CDVLDownloader(output_dir=str(temp_dir)) as downloader:
+                    endpoints = downloader.config["endpoints"]
+                    endpoints["video_base_url"] = str(server.make_url("/view"))
+                    await downloader._warm_connections(2)
+                    return len(downloader.session.cookie_jar)
+
+        # The login's cookies live in the session's jar; warm-up stays out of it
+        assert asyncio.run(run()) == 0
+        assert heads == ["/", "/"]
+
+
+VIDEO_PAGE = """<!DOCTYPE html>
+<html><body>
+<form method="post"><input name="q" value="search"><button>Search</button></form>
+<form method="post">
+  <input type="hidden" name="videoId" value="42">
+  <input type="hidden" name="distributionType" value="Other">
+  <input name="__RequestVerificationToken" type="hidden" value="tok123">
+  <input type="hidden" name="ufprt" value="ufp456">
+  <button type="submit">Generate a <b>Download Manager Link</b></button>
+</form>
+</body></html>
+"""
+
+LINK_PAGE = """<!DOCTYPE html>
+<html><body>
+<table class="downloadTable">
+  <tr><th>Type</th><th>Link</th></tr>
+  <tr><td>Windows</td><td>wget https://example.org/GetFileDownload/42/win</td></tr>
+  <tr><td>Other</td><td> https://example.org/GetFileDownload/42/a/b </td></tr>
+</table>
+</body></html>
+"""
+
+
+def make_video_app():
+    """App serving a video page at /view and its download link on POST
+
+    Returns the app and the list of submitted forms.
+    """
+    forms: list = []
+
+    async def view(request: web.Request) -> web.Response:
+        assert request.query["videoid"] == "42"
+        return web.Response(text=VIDEO_PAGE, content_type="text/html")
+
+    async def submit(request: web.Request) -> web.Response:
+        forms.append(dict(await request.post()))
+        return web.Response(text=LINK_PAGE, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/view", view)
+    app.router.add_post("/view", submit)
+    return app, forms
+
+
+class TestGetDownloadLink:
+    """Tests for CDVLDownloader.get_download_link()"""
+
+    def test_submits_form_and_extracts_link(self, temp_dir):
+        app, forms = make_video_app()
+
+        async def run():
+            async with TestServer(app) as server:
+                async with CDVLDownloader(output_dir=str(temp_dir)) as downloader:
+                    endpoints = downloader.config["endpoints"]
+                    endpoints["video_base_url"] = str(server.make_url("/view"))
+                    return await downloader.get_download_link(42)
+
+        assert asyncio.run(run()) == "https://example.org/GetFileDownload/42/a/b"
+        assert forms == [
+            {
+                "videoId": "42",
+                "distributionType": "Other",
+                "__RequestVerificationToken": "tok123",
+                "ufprt": "ufp456",
+            }
+        ]
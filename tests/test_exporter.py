@@ -24,6 +24,21 @@ class TestCDVLExporter:
         assert json.loads(exporter._flatten_value([1, "two"])) == [1, "two"]
         assert json.loads(exporter._flatten_value({"k": "v"})) == {"k": "v"}
 
+    def test_column_order(self, temp_dir):
+        """Preferred columns come first, then others in first-seen order"""
+        exporter = CDVLExporter(str(temp_dir / "in.jsonl"), str(temp_dir / "out.csv"))
+        records = [
+            {"extra": 1, "title": "a", "id": 1},
+            {"id": 2, "other": 2, "url": "u", "extra": 3},
+        ]
+        assert exporter._get_all_columns(records) == [
+            "id",
+            "url",
+            "title",
+            "extra",
+            "other",
+        ]
+
     def test_export_basic(self, sample_videos_jsonl, temp_dir):
         """Basic JSONL to CSV export"""
         output_path = temp_dir / "output.csv"
@@ -61,3 +76,10 @@ class TestCDVLExporter:
         empty.write_text("")
         exporter = CDVLExporter(str(empty), str(temp_dir / "out.csv"))
         assert exporter.export() is False
+
+        # No valid records, streamed with explicit columns
+        invalid = temp_dir / "invalid.jsonl"
+        invalid.write_text("not json\n\n")
+        exporter = CDVLExporter(str(invalid), str(temp_dir / "out.csv"), ["id"])
+        assert exporter.export() is False
+        assert not (temp_dir / "out.csv").exists()
@@ -15,6 +15,19 @@ class TestCDVLSiteGenerator:
         assert "<" not in result
         assert "\\u003c" in result
 
+    def test_escape_json_line_separators(self):
+        """U+2028/U+2029 are escaped for older JavaScript engines"""
+        gen = CDVLSiteGenerator()
+        result = gen.escape_json(["a\u2028b\u2029c"])
+        assert result == '["a\\u2028b\\u2029c"]'
+
+    def test_truncate_text(self):
+        """Long text is cut at the last space before max_length"""
+        gen = CDVLSiteGenerator()
+        assert gen.truncate_text("short") == "short"
+        assert gen.truncate_text("one two three", 9) == "one two..."
+        assert gen.truncate_text("onetwothree", 6) == "onetwo..."
+
     def test_load_videos(self, sample_videos_jsonl, temp_dir):
         """Loading videos from JSONL"""
         gen = CDVLSiteGenerator(input_file=str(sample_videos_jsonl))
@@ -0,0 +1,42 @@
+"""
+Tests for cdvl_crawler.__main__ module
+"""
+
+import argparse
+import asyncio
+
+import pytest
+
+from cdvl_crawler.__main__ import build_parser, run_downloader
+
+
+def parse(argv: list[str]) -> argparse.Namespace:
+    return build_parser(argv[0]).parse_args(argv)
+
+
+class TestDownloadOptions:
+    """Tests for validation of the download command's options"""
+
+    def test_max_concurrent_rejects_zero(self):
+        with pytest.raises(SystemExit):
+            parse(["download", "1", "--max-concurrent", "0"])
+        with pytest.raises(SystemExit):
+            parse(["crawl", "--max-concurrent", "0"])
+
+        assert parse(["download", "1", "--max-concurrent", "2"]).max_concurrent == 2
+        assert parse(["download", "1"]).max_concurrent is None
+
+    def test_run_downloader_rejects_zero_max_concurrent(self):
+        """An explicit 0 is not replaced by the default"""
+        args = parse(["download", "1"])
+        args.max_concurrent = 0
+        assert asyncio.run(run_downloader(args)) == 1
+
+    def test_segments_rejects_zero(self):
+        with pytest.raises(SystemExit):
+            parse(["download", "1", "--segments", "0"])
+        assert parse(["download", "1", "--segments", "1"]).segments == 1
+
+        args = parse(["download", "1"])
+        args.segments = 0
+        assert asyncio.run(run_downloader(args)) == 1
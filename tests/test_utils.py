@@ -11,6 +11,7 @@ import pytest
 from cdvl_crawler.utils import (
     load_config,
     parse_content_disposition,
+    parse_video_ids,
     get_credentials,
     require_license_acceptance,
 )
@@ -58,6 +59,22 @@ class TestParseContentDisposition:
         assert parse_content_disposition(None) is None
 
 
+class TestParseVideoIds:
+    """Tests for parse_video_ids()"""
+
+    def test_parses_id_lists(self):
+        assert parse_video_ids("42") == [42]
+        assert parse_video_ids("1,5,10") == [1, 5, 10]
+        assert parse_video_ids(" 1 , 5 ,10 ") == [1, 5, 10]
+
+    def test_rejects_invalid_input(self):
+        for value in ["", "abc", "1,,2", "1,2,", "1;2", "1.5", "-3"]:
+            with pytest.raises(ValueError, match="Invalid video ID format"):
+                parse_video_ids(value)
+        with pytest.raises(ValueError, match="positive"):
+            parse_video_ids("1,0,2")
+
+
 class TestGetCredentials:
     """Tests for get_credentials()"""
 